@@ -0,0 +1,96 @@
+# Busca aproximada com paralelismo de bits: o estado da busca cabe em
+# inteiros (um bit por posição do padrão) e cada símbolo do texto custa
+# poucas operações de palavra, qualquer que seja o tamanho do padrão.
+from buscas import Busca
+
+
+def mascaras(padrao, casa):
+    # Para cada símbolo, uma máscara com o bit i ligado onde padrao[i] == símbolo
+    # (ou desligado, se casa=False, como no Shift-Or)
+    m = len(padrao)
+    todos = (1 << m) - 1
+    tabela = {}
+    for i, simbolo in enumerate(padrao):
+        tabela[simbolo] = tabela.get(simbolo, 0) | (1 << i)
+    if not casa:
+        tabela = {simbolo: todos & ~bits for simbolo, bits in tabela.items()}
+    return tabela
+
+
+class BuscaShiftOr(Busca):
+    # Shift-Or (Bitap) com até k símbolos trocados (distância de Hamming).
+    # Um bit 0 na posição i do vetor R[d] indica que padrao[:i+1] casa com
+    # o fim do texto lido com no máximo d trocas.
+    def __init__(self, k=1, rastro=None):
+        super().__init__(rastro)
+        self.k = k
+
+    def iterar(self, texto, padrao):
+        m = len(padrao)
+        comparacoes = 0
+        self.comparacoes = 0
+        if m == 0:
+            return
+        self.registrar(f"\n==== :: BUSCA SHIFT-OR (k={self.k}) ::======\n")
+        todos = (1 << m) - 1
+        ultimo = 1 << (m - 1)
+        b = mascaras(padrao, casa=False)
+        r = [todos] * (self.k + 1)
+        for i, simbolo in enumerate(texto):
+            comparacoes += 1
+            bc = b.get(simbolo, todos)
+            anterior = r[0]
+            r[0] = ((anterior << 1) | bc) & todos
+            for d in range(1, self.k + 1):
+                atual = r[d]
+                # Casa o símbolo com d trocas, ou troca este símbolo a partir de d-1
+                r[d] = (((atual << 1) | bc) & (anterior << 1)) & todos
+                anterior = atual
+            if not r[self.k] & ultimo:
+                self.comparacoes = comparacoes
+                yield i - m + 1
+        self.comparacoes = comparacoes
+
+
+class BuscaMyers(Busca):
+    # Algoritmo de Myers para distância de edição (Levenshtein) com até k
+    # inserções, remoções ou trocas. Mantém as diferenças verticais da matriz
+    # de programação dinâmica em dois vetores de bits (Pv e Mv). Como uma
+    # ocorrência com edições não tem tamanho fixo, reporta a posição final.
+    def __init__(self, k=1, rastro=None):
+        super().__init__(rastro)
+        self.k = k
+
+    def iterar(self, texto, padrao):
+        m = len(padrao)
+        comparacoes = 0
+        self.comparacoes = 0
+        if m == 0:
+            return
+        self.registrar(f"\n==== :: BUSCA MYERS (k={self.k}) ::======\n")
+        todos = (1 << m) - 1
+        ultimo = 1 << (m - 1)
+        peq = mascaras(padrao, casa=True)
+        pv = todos
+        mv = 0
+        distancia = m
+        for j, simbolo in enumerate(texto):
+            comparacoes += 1
+            eq = peq.get(simbolo, 0)
+            xv = eq | mv
+            xh = ((((eq & pv) + pv) & todos) ^ pv) | eq
+            ph = mv | (~(xh | pv) & todos)
+            mh = pv & xh
+            # A última linha da coluna dá a distância do padrão até o texto terminado em j
+            if ph & ultimo:
+                distancia += 1
+            elif mh & ultimo:
+                distancia -= 1
+            ph = (ph << 1) & todos
+            mh = (mh << 1) & todos
+            pv = mh | (~(xv | ph) & todos)
+            mv = ph & xv
+            if distancia <= self.k:
+                self.comparacoes = comparacoes
+                yield j
+        self.comparacoes = comparacoes
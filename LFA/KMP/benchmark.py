@@ -0,0 +1,210 @@
+# Benchmark reprodutível dos motores de busca.
+# Varre todos os motores sobre os arquivos de `arquivos/` e sobre textos
+# gerados, com vários tamanhos de padrão e de alfabeto, e grava os resultados
+# em JSON para comparar versões.
+import argparse
+import json
+import os
+import platform
+import random
+import string
+import tracemalloc
+from time import perf_counter_ns
+
+from buscas import BuscaComparacao, BuscaKMP
+from saltos import BuscaBoyerMoore, BuscaHorspool, BuscaDoisSentidos
+from multipadrao import BuscaAhoCorasick, BuscaRabinKarp
+from aproximada import BuscaShiftOr, BuscaMyers
+from indice import BuscaIndexada
+
+# Erros permitidos nos motores de busca aproximada
+K_APROXIMADA = 1
+
+MOTORES = {
+    "comparacao": BuscaComparacao,
+    "kmp": BuscaKMP,
+    "boyer_moore": BuscaBoyerMoore,
+    "horspool": BuscaHorspool,
+    "two_way": BuscaDoisSentidos,
+    "aho_corasick": BuscaAhoCorasick,
+    "rabin_karp": BuscaRabinKarp,
+    "shift_or": lambda: BuscaShiftOr(k=K_APROXIMADA),
+    "myers": lambda: BuscaMyers(k=K_APROXIMADA),
+    "indexada": BuscaIndexada,
+}
+# Motores que recebem uma lista de padrões
+MULTIPADRAO = {"aho_corasick", "rabin_karp"}
+# Tamanho máximo de texto (em caracteres) de cada motor; acima dele o motor é
+# pulado. Os mais lentos passariam de horas num texto de 1 GB, e a busca
+# indexada monta o vetor de sufixos com vários arrays do tamanho do texto
+MAXIMO_POR_MOTOR = {
+    "comparacao": 2_000_000,
+    "shift_or": 2_000_000,
+    "myers": 2_000_000,
+    "indexada": 2_000_000,
+}
+# Acima deste tamanho não é feita a rodada extra com o tracemalloc
+MEMORIA_ATE = 10_000_000
+
+PASTA_ARQUIVOS = os.path.join(os.path.dirname(os.path.abspath(__file__)), "arquivos")
+ARQUIVOS = ["a1.txt", "a2.txt", "a3.txt", "maior.txt"]
+
+TAMANHOS_PADRAO = [2, 8, 32]
+# Alfabetos dos textos gerados: binário, DNA, minúsculas e texto imprimível
+ALFABETOS = {
+    2: "ab",
+    4: "acgt",
+    26: string.ascii_lowercase,
+    95: string.printable[:95],
+}
+# Tamanho dos blocos de bytes aleatórios em gerar_texto
+BLOCO_GERACAO = 1 << 24
+
+
+def gerar_texto(tamanho, alfabeto, semente):
+    # Texto aleatório mas reprodutível a partir da semente. Os bytes aleatórios
+    # são gerados e traduzidos para o alfabeto em blocos, direto num único
+    # bytearray, para que um texto de 1 GB ocupe só o buffer e a str final
+    gerador = random.Random(semente)
+    tabela = bytes(ord(alfabeto[b % len(alfabeto)]) for b in range(256))
+    buffer = bytearray(tamanho)
+    for inicio in range(0, tamanho, BLOCO_GERACAO):
+        fim = min(inicio + BLOCO_GERACAO, tamanho)
+        buffer[inicio:fim] = gerador.randbytes(fim - inicio).translate(tabela)
+    return buffer.decode("ascii")
+
+
+def escolher_padrao(texto, tamanho, semente):
+    # Padrão retirado do próprio texto, para garantir ao menos uma ocorrência
+    if len(texto) < tamanho:
+        return None
+    gerador = random.Random(semente)
+    inicio = gerador.randrange(len(texto) - tamanho + 1)
+    return texto[inicio:inicio + tamanho]
+
+
+def medir(motor, texto, tamanho_bytes, padrao, aquecimento, repeticoes, medir_memoria=True):
+    # Rodadas de aquecimento, depois as medidas com perf_counter_ns. A mesma
+    # instância é usada em todas as rodadas: a busca indexada monta o índice
+    # no aquecimento e as medidas ficam só com as consultas. As ocorrências
+    # são contadas, sem guardar a lista de posições
+    busca = motor()
+    for _ in range(aquecimento):
+        busca.contar(texto, padrao)
+    tempos = []
+    for _ in range(repeticoes):
+        t0 = perf_counter_ns()
+        ocorrencias, comparacoes = busca.contar(texto, padrao)
+        t1 = perf_counter_ns()
+        tempos.append(t1 - t0)
+    # Pico de memória medido numa rodada separada, pois o tracemalloc atrasa a busca
+    pico = None
+    if medir_memoria:
+        tracemalloc.start()
+        busca.contar(texto, padrao)
+        _, pico = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    tempos.sort()
+    mediana = tempos[len(tempos) // 2]
+    segundos = mediana / 1e9
+    return {
+        "tempo_min_ns": tempos[0],
+        "tempo_mediana_ns": mediana,
+        "mb_por_s": (tamanho_bytes / 1e6) / segundos if segundos else None,
+        "comparacoes": comparacoes,
+        "comparacoes_por_byte": comparacoes / tamanho_bytes if tamanho_bytes else None,
+        "ocorrencias": ocorrencias,
+        "pico_memoria_bytes": pico,
+    }
+
+
+def corpus(tamanhos_gerados, semente):
+    # Gera (nome, alfabeto, texto, tamanho em bytes) para os arquivos do
+    # projeto e os textos gerados; o tamanho em bytes é calculado uma vez por texto
+    for nome in ARQUIVOS:
+        caminho = os.path.join(PASTA_ARQUIVOS, nome)
+        if os.path.exists(caminho):
+            with open(caminho, 'r') as arquivo:
+                texto = arquivo.read().strip()
+            yield nome, len(set(texto)), texto, len(texto.encode("utf-8"))
+    for tamanho in tamanhos_gerados:
+        for tamanho_alfabeto, alfabeto in ALFABETOS.items():
+            texto = gerar_texto(tamanho, alfabeto, semente)
+            # Textos gerados são ASCII: um byte por caractere
+            yield f"gerado_{tamanho}_{tamanho_alfabeto}", tamanho_alfabeto, texto, len(texto)
+
+
+def executar(tamanhos_gerados, motores, aquecimento, repeticoes, semente,
+             maximo_por_motor=MAXIMO_POR_MOTOR, memoria_ate=MEMORIA_ATE):
+    resultados = []
+    for nome, tamanho_alfabeto, texto, tamanho_bytes in corpus(tamanhos_gerados, semente):
+        ativos = [motor for motor in motores if len(texto) <= maximo_por_motor.get(motor, len(texto))]
+        for motor in motores:
+            if motor not in ativos:
+                print(f"{nome:>24} {motor:<12} pulado (texto acima de {maximo_por_motor[motor]} caracteres)")
+        medir_memoria = len(texto) <= memoria_ate
+        for tamanho_padrao in TAMANHOS_PADRAO:
+            padrao = escolher_padrao(texto, tamanho_padrao, semente)
+            if padrao is None:
+                continue
+            for nome_motor in ativos:
+                # Os motores de vários padrões recebem uma lista com o padrão
+                padroes = [padrao] if nome_motor in MULTIPADRAO else padrao
+                medida = medir(MOTORES[nome_motor], texto, tamanho_bytes, padroes,
+                               aquecimento, repeticoes, medir_memoria)
+                medida.update({
+                    "texto": nome,
+                    "tamanho_texto": len(texto),
+                    "tamanho_alfabeto": tamanho_alfabeto,
+                    "tamanho_padrao": tamanho_padrao,
+                    "motor": nome_motor,
+                })
+                resultados.append(medida)
+                print(f"{nome:>24} m={tamanho_padrao:<3} {nome_motor:<12} "
+                      f"{medida['tempo_mediana_ns'] / 1e6:10.3f} ms  "
+                      f"{medida['comparacoes_por_byte']:.3f} comp/byte")
+    return resultados
+
+
+def _limite(texto):
+    # "MOTOR=TAMANHO" -> ("MOTOR", TAMANHO)
+    motor, separador, tamanho = texto.partition("=")
+    if not separador or motor not in MOTORES or not tamanho.isdigit():
+        raise argparse.ArgumentTypeError(f"Esperado MOTOR=TAMANHO: {texto!r}")
+    return motor, int(tamanho)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark dos motores de busca.")
+    parser.add_argument("--gerados", type=int, nargs="*", default=[1_000_000],
+                        help="Tamanhos (em caracteres) dos textos gerados, ex.: 1000000 1000000000")
+    parser.add_argument("--motores", nargs="*", default=list(MOTORES), choices=list(MOTORES))
+    parser.add_argument("--aquecimento", type=int, default=1)
+    parser.add_argument("--repeticoes", type=int, default=5)
+    parser.add_argument("--semente", type=int, default=42)
+    parser.add_argument("--maximo-por-motor", type=_limite, action="append", default=[], metavar="MOTOR=TAMANHO",
+                        help="Maior texto (em caracteres) em que o motor roda; 0 tira o limite")
+    parser.add_argument("--memoria-ate", type=int, default=MEMORIA_ATE,
+                        help="Maior texto (em caracteres) com a rodada de pico de memória (tracemalloc)")
+    parser.add_argument("--saida", default="benchmark.json", help="Arquivo JSON com os resultados")
+    args = parser.parse_args()
+
+    maximo_por_motor = dict(MAXIMO_POR_MOTOR)
+    for motor, tamanho in args.maximo_por_motor:
+        if tamanho:
+            maximo_por_motor[motor] = tamanho
+        else:
+            maximo_por_motor.pop(motor, None)
+    resultados = executar(args.gerados, args.motores, args.aquecimento, args.repeticoes, args.semente,
+                          maximo_por_motor, args.memoria_ate)
+    with open(args.saida, 'w', encoding='utf-8') as arquivo:
+        json.dump({
+            "python": platform.python_version(),
+            "plataforma": platform.platform(),
+            "semente": args.semente,
+            "aquecimento": args.aquecimento,
+            "repeticoes": args.repeticoes,
+            "maximo_por_motor": maximo_por_motor,
+            "resultados": resultados,
+        }, arquivo, indent=2)
+    print(f"Resultados gravados em {args.saida}")
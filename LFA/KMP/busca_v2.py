@@ -2,87 +2,54 @@ import tkinter as tk
 from tkinter import scrolledtext, filedialog
 from time import time
 
-# Classe para busca básica
-class Busca:
-    def buscar(self, texto, padrao):
-        raise NotImplementedError("Método buscar não implementado")
-
-class BuscaComparacao(Busca):
-    def buscar(self, texto, padrao):
-        ocorrencias = []
-        qntd_comparacoes = 0
-        output_text.insert(tk.END, "=====:: BUSCA BASICA COMPARACOES ::=====\n")
-        # Percorre o texto
-        for i in range(len(texto) - len(padrao) + 1):  
-            achou = True
-            # Percorre o padrão
-            for j in range(len(padrao)):
-                # Incrementa a quantidade de comparações
-                qntd_comparacoes += 1
-                # Exibe a comparação
-                output_text.insert(tk.END, f"Comparando: [{texto[i:i+len(padrao)]}] com [{padrao}]\n")
-                # Se os caracteres forem diferentes, sai do loop
-                if padrao[j] != texto[i + j]:
-                    # Se não achou, sai do loop
-                    achou = False
-                    break 
-            # Se achou, adiciona a posição na lista de ocorrências
-            if achou:
-                # Adiciona a posição na lista de ocorrências
-                ocorrencias.append(i)
-                # Exibe a posição da ocorrência
-        return ocorrencias, qntd_comparacoes
-
-class BuscaKMP(Busca):
-    def prefixo(self, padrao):
-        # Inicializa a lista de prefixos
-        prefixo = [0] * len(padrao)
-        p = 0
-        # Percorre o padrão
-        for i in range(1, len(padrao)):
-            # Se os caracteres forem diferentes
-            while p > 0 and padrao[p] != padrao[i]:
-                # Atualiza o valor de p
-                p = prefixo[p - 1]
-                # Se os caracteres forem iguais
-            if padrao[p] == padrao[i]:
-                p += 1
-                # Atualiza o valor do prefixo
-            prefixo[i] = p
-            # Retorna a lista de prefixos
-        return prefixo
-    
-    # Método para buscar o padrão no texto
-    def buscar(self, texto, padrao):
-        prefixo = self.prefixo(padrao)
-        i = 0
-        j = 0
-        ocorrencias = []
-        comparacoes = 0
-        output_text.insert(tk.END, "\n==== :: BUSCA KMP COMPARACOES ::======\n")
-        # Percorre o texto
-        while i < len(texto):
-            comparacoes += 1
-            output_text.insert(tk.END, f"Comparando: [{texto[i:i+len(padrao)]}] com [{padrao}]\n")
-            # Se os caracteres forem iguais
-            if padrao[j] == texto[i]:
-                i += 1
-                j += 1
-                # Se achou o padrão
-                if j == len(padrao):
-                    # Adiciona a posição na lista de ocorrências
-                    ocorrencias.append(i - j)  
-                    # Atualiza o valor de j
-                    j = prefixo[j - 1]
-            else:
-                # Se os caracteres forem diferentes
-                if j != 0:
-                    # Atualiza o valor de j
-                    j = prefixo[j - 1]
-                else:
-                    # Atualiza o valor de i
-                    i += 1
-        return ocorrencias, comparacoes
+from buscas import BuscaComparacao, BuscaKMP
+from multipadrao import BuscaAhoCorasick, BuscaRabinKarp
+from saltos import escolher_busca, tamanho_alfabeto
+from rastro import Rastro, NIVEIS
+from indice import BuscaIndexada
+from aproximada import BuscaShiftOr, BuscaMyers
+from varredura import Varredura
+from incremental import BuscaIncremental
+
+# No rastro amostrado, registra uma a cada N comparações
+INTERVALO_AMOSTRA = 100
+# Arquivos maiores que isto são ignorados na busca em diretório (100 MB)
+TAMANHO_MAXIMO_ARQUIVO = 100 * 1024 * 1024
+
+# Envia as mensagens de comparação dos motores para a área de resultados
+def registrar_saida(mensagem):
+    output_text.insert(tk.END, mensagem)
+
+# Índice do texto, mantido entre os cliques em "Buscar"
+busca_indexada = BuscaIndexada()
+
+# Busca ao digitar: mantém as ocorrências e rebusca só o trecho editado
+busca_incremental = None
+
+def atualizar_busca_ao_digitar(event=None):
+    global busca_incremental
+    # Limpa a marca de modificado para receber o próximo evento
+    entry_texto.edit_modified(False)
+    if not busca_ao_digitar.get():
+        return
+    padrao = entry_padro.get().strip().lower()
+    if not padrao:
+        label_ao_digitar.config(text="")
+        return
+    texto = entry_texto.get("1.0", "end-1c")
+    t0 = time()
+    if busca_incremental is None or busca_incremental.padrao != padrao:
+        busca_incremental = BuscaIncremental(padrao)
+        ocorrencias = busca_incremental.buscar_tudo(texto)
+    else:
+        ocorrencias = busca_incremental.atualizar(texto)
+    t1 = time()
+    primeiras = ocorrencias[:20]
+    label_ao_digitar.config(text=f"{len(ocorrencias)} ocorrências ({(t1 - t0) * 1000:.3f} ms): {primeiras}{' ...' if len(ocorrencias) > 20 else ''}")
+
+# Cria o rastro das comparações com o nível escolhido na interface
+def novo_rastro():
+    return Rastro(nivel=NIVEIS[nivel_rastro.get()], intervalo=INTERVALO_AMOSTRA)
 
 # Função para selecionar o arquivo e ler seu conteúdo
 def abrir_arquivo():
@@ -96,6 +63,27 @@ def abrir_arquivo():
         except Exception as e:
             output_text.insert(tk.END, f"Erro ao abrir arquivo: {e}\n")
 
+# Busca o padrão em todos os arquivos de uma pasta, exibindo cada arquivo ao terminar
+def buscar_diretorio():
+    padrao = entry_padro.get().strip().lower()
+    if not padrao:
+        output_text.insert(tk.END, "Padrão de busca não informado!\n")
+        return
+    pasta = filedialog.askdirectory(title="Selecione a pasta")
+    if not pasta:
+        return
+    output_text.delete("1.0", tk.END)
+    output_text.insert(tk.END, f"====:: BUSCA EM {pasta} ::====\n")
+    varredura = Varredura(tamanho_maximo=TAMANHO_MAXIMO_ARQUIVO)
+    for caminho, ocorrencias, motivo in varredura.buscar(pasta, padrao):
+        if motivo is not None:
+            output_text.insert(tk.END, f"{caminho}: ignorado ({motivo})\n")
+        elif ocorrencias:
+            output_text.insert(tk.END, f"{caminho}: {len(ocorrencias)} ocorrências {ocorrencias}\n")
+        # Atualiza a janela a cada arquivo, sem esperar a pasta toda
+        root.update_idletasks()
+    output_text.insert(tk.END, varredura.resumo() + "\n")
+
 def mostrar_resultados():
     texto = entry_texto.get("1.0", tk.END).strip()
     padrao = entry_padro.get().strip().lower()
@@ -110,12 +98,49 @@ def mostrar_resultados():
     # Inicializa variáveis para consolidar os resultados
     resultados_finais = []
 
+    # Vários padrões separados por vírgula: uma única passada com Aho-Corasick
+    if "," in padrao:
+        padroes = [p.strip() for p in padrao.split(",") if p.strip()]
+        rastro = novo_rastro()
+        busca = BuscaAhoCorasick(rastro=rastro)
+        t0 = time()
+        ocorrencias, qntd_comparacoes = busca.buscar(texto, padroes)
+        t1 = time()
+        tempo_aho = (t1 - t0) * 1000
+        # Escreve o rastro de uma vez, fora da medição de tempo
+        rastro.descarregar(registrar_saida)
+        resultados_finais.append("\n")
+        resultados_finais.append("====:: BUSCA AHO-CORASICK ::====")
+        resultados_finais.append(f"Ocorrências (padrão, posição): {ocorrencias}")
+        resultados_finais.append(f"Quantidade de comparações: {qntd_comparacoes}")
+        resultados_finais.append(f"Tempo de execução: {tempo_aho:.3f} ms")
+        resultados_finais.append("======================================")
+        # Padrões todos do mesmo tamanho: compara também com o Rabin-Karp
+        if len({len(p) for p in padroes}) == 1:
+            rastro = novo_rastro()
+            busca = BuscaRabinKarp(rastro=rastro)
+            t2 = time()
+            ocorrencias, qntd_comparacoes = busca.buscar(texto, padroes)
+            t3 = time()
+            tempo_rabin = (t3 - t2) * 1000
+            rastro.descarregar(registrar_saida)
+            resultados_finais.append("\n")
+            resultados_finais.append("====:: BUSCA RABIN-KARP ::====")
+            resultados_finais.append(f"Ocorrências (padrão, posição): {ocorrencias}")
+            resultados_finais.append(f"Quantidade de comparações: {qntd_comparacoes}")
+            resultados_finais.append(f"Tempo de execução: {tempo_rabin:.3f} ms")
+            resultados_finais.append("======================================")
+        output_text.insert(tk.END, "\n".join(resultados_finais) + "\n")
+        return
+
     # Busca Básica
-    busca = BuscaComparacao()
+    rastro = novo_rastro()
+    busca = BuscaComparacao(rastro=rastro)
     t0 = time()
     ocorrencias, qntd_comparacoes = busca.buscar(texto, padrao)
     t1 = time()
     tempo_compara = (t1 - t0) * 1000
+    rastro.descarregar(registrar_saida)
     resultados_finais.append("\n")
     resultados_finais.append("====:: BUSCA BASICA ::====")
     resultados_finais.append(f"Posições das ocorrências: {ocorrencias}")
@@ -125,17 +150,68 @@ def mostrar_resultados():
     resultados_finais.append("\n")
 
     # Busca KMP
-    busca = BuscaKMP()
+    rastro = novo_rastro()
+    busca = BuscaKMP(rastro=rastro)
     t2 = time()
     ocorrencias, qntd_comparacoes = busca.buscar(texto, padrao)
     t3 = time()
     tempo_kmp = (t3 - t2) * 1000
+    rastro.descarregar(registrar_saida)
     resultados_finais.append("====:: BUSCA KMP ::=====")
     resultados_finais.append(f"Posições das ocorrências: {ocorrencias}")
     resultados_finais.append(f"Quantidade de comparações: {qntd_comparacoes}")
     resultados_finais.append(f"Tempo de execução: {tempo_kmp:.3f} ms")
     resultados_finais.append("======================================")
 
+    resultados_finais.append("\n")
+
+    # Busca com saltos, motor escolhido pelo padrão e pelo alfabeto do texto
+    rastro = novo_rastro()
+    busca = escolher_busca(padrao, tamanho_alfabeto(texto), rastro=rastro)
+    t4 = time()
+    ocorrencias, qntd_comparacoes = busca.buscar(texto, padrao)
+    t5 = time()
+    tempo_saltos = (t5 - t4) * 1000
+    rastro.descarregar(registrar_saida)
+    resultados_finais.append(f"====:: BUSCA AUTOMATICA ({type(busca).__name__}) ::=====")
+    resultados_finais.append(f"Posições das ocorrências: {ocorrencias}")
+    resultados_finais.append(f"Quantidade de comparações: {qntd_comparacoes}")
+    resultados_finais.append(f"Tempo de execução: {tempo_saltos:.3f} ms")
+    resultados_finais.append("======================================")
+
+    # Busca aproximada, com até k erros
+    erros = entry_erros.get().strip()
+    k = int(erros) if erros.isdigit() else 0
+    if k > 0:
+        for titulo, rotulo, motor in [("BUSCA SHIFT-OR (HAMMING)", "Posições das ocorrências", BuscaShiftOr),
+                                      ("BUSCA MYERS (LEVENSHTEIN)", "Posições finais das ocorrências", BuscaMyers)]:
+            rastro = novo_rastro()
+            busca = motor(k=k, rastro=rastro)
+            t0 = time()
+            ocorrencias, qntd_comparacoes = busca.buscar(texto, padrao)
+            t1 = time()
+            tempo_aprox = (t1 - t0) * 1000
+            rastro.descarregar(registrar_saida)
+            resultados_finais.append("\n")
+            resultados_finais.append(f"====:: {titulo}, k={k} ::=====")
+            resultados_finais.append(f"{rotulo}: {ocorrencias}")
+            resultados_finais.append(f"Quantidade de comparações: {qntd_comparacoes}")
+            resultados_finais.append(f"Tempo de execução: {tempo_aprox:.3f} ms")
+            resultados_finais.append("======================================")
+
+    # Busca no FM-index, construído só quando o texto muda
+    if modo_indice.get():
+        t6 = time()
+        ocorrencias, qntd_comparacoes = busca_indexada.buscar(texto, padrao)
+        t7 = time()
+        tempo_indice = (t7 - t6) * 1000
+        resultados_finais.append("\n")
+        resultados_finais.append("====:: BUSCA INDEXADA (FM-INDEX) ::=====")
+        resultados_finais.append(f"Posições das ocorrências: {ocorrencias}")
+        resultados_finais.append(f"Quantidade de consultas ao índice: {qntd_comparacoes}")
+        resultados_finais.append(f"Tempo de execução: {tempo_indice:.3f} ms")
+        resultados_finais.append("======================================")
+
     # Exibe os resultados de forma consolidada no final
     output_text.insert(tk.END, "\n".join(resultados_finais) + "\n")
 
@@ -143,23 +219,50 @@ def mostrar_resultados():
 # Criar a interface gráfica
 root = tk.Tk()
 root.title("Busca de Padrões no Texto")
-root.geometry("700x500")  # Ajuste do tamanho da janela principal
+root.geometry("700x900")  # Ajuste do tamanho da janela principal
 # Labels
 label_texto = tk.Label(root, text="Texto a ser pesquisado:")
 label_texto.pack()
 # Campo de texto para o conteúdo com tamanho maior
 entry_texto = scrolledtext.ScrolledText(root, wrap=tk.WORD, width=80, height=15)  # Aumenta o tamanho da área de texto
 entry_texto.pack()
-label_padro = tk.Label(root, text="Digite o padrão de busca:")
+label_padro = tk.Label(root, text="Digite o padrão de busca (vários padrões separados por vírgula):")
 label_padro.pack()
 # Campo de entrada para o padrão com tamanho maior
 entry_padro = tk.Entry(root, width=50)  # Aumenta o tamanho do campo de entrada
 entry_padro.pack()
+# Erros permitidos na busca aproximada (0 = só ocorrências exatas)
+label_erros = tk.Label(root, text="Erros permitidos (busca aproximada):")
+label_erros.pack()
+entry_erros = tk.Entry(root, width=5)
+entry_erros.insert(0, "0")
+entry_erros.pack()
+# Padrão alterado também atualiza a busca ao digitar
+entry_padro.bind("<KeyRelease>", atualizar_busca_ao_digitar)
+entry_texto.bind("<<Modified>>", atualizar_busca_ao_digitar)
 # Botões
 btn_abrir_arquivo = tk.Button(root, text="Abrir Arquivo", command=abrir_arquivo)
 btn_abrir_arquivo.pack()
+# Nível do rastro de comparações
+nivel_rastro = tk.StringVar(root, value="Completo")
+label_rastro = tk.Label(root, text="Rastro das comparações:")
+label_rastro.pack()
+menu_rastro = tk.OptionMenu(root, nivel_rastro, *NIVEIS)
+menu_rastro.pack()
+# Modo índice: reaproveita o FM-index do texto entre as buscas
+modo_indice = tk.BooleanVar(root, value=False)
+check_indice = tk.Checkbutton(root, text="Modo índice (FM-index)", variable=modo_indice)
+check_indice.pack()
 btn_buscar = tk.Button(root, text="Buscar", command=mostrar_resultados)
 btn_buscar.pack()
+btn_buscar_diretorio = tk.Button(root, text="Buscar em Diretório", command=buscar_diretorio)
+btn_buscar_diretorio.pack()
+# Busca ao digitar, com o resultado resumido abaixo do botão
+busca_ao_digitar = tk.BooleanVar(root, value=False)
+check_ao_digitar = tk.Checkbutton(root, text="Buscar ao digitar", variable=busca_ao_digitar, command=atualizar_busca_ao_digitar)
+check_ao_digitar.pack()
+label_ao_digitar = tk.Label(root, text="", wraplength=650)
+label_ao_digitar.pack()
 # Área de texto para exibir resultados
 output_text = scrolledtext.ScrolledText(root, wrap=tk.WORD, width=80, height=15)  # Aumenta a área de resultados
 output_text.pack()
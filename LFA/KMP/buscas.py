@@ -0,0 +1,190 @@
+# Motores de busca de padrões, sem dependência de interface gráfica.
+# A interface (busca_v2.py) e os modos de linha de comando importam daqui.
+from itertools import islice
+
+
+# Classe para busca básica
+class Busca:
+    def __init__(self, rastro=None):
+        # Rastro opcional das comparações (ver rastro.py); sem rastro nada é registrado
+        self.rastro = rastro
+        self.comparacoes = 0
+
+    def registrar(self, mensagem):
+        if self.rastro is not None:
+            self.rastro.adicionar(mensagem)
+
+    def comparando(self, texto, inicio, padrao):
+        # Registra a janela comparada, respeitando o nível/amostragem do rastro
+        if self.rastro is not None and self.rastro.amostrar():
+            self.rastro.adicionar(f"Comparando: [{texto[inicio:inicio+len(padrao)]}] com [{padrao}]\n")
+
+    # Cada motor implementa `iterar`, que gera as posições uma a uma e mantém
+    # em self.comparacoes o total de comparações feitas até o momento.
+    # Os outros modos são montados em cima dele.
+    def iterar(self, texto, padrao):
+        raise NotImplementedError("Método iterar não implementado")
+
+    def buscar(self, texto, padrao):
+        # Lista com todas as ocorrências
+        ocorrencias = list(self.iterar(texto, padrao))
+        return ocorrencias, self.comparacoes
+
+    def contar(self, texto, padrao):
+        # Só a quantidade de ocorrências, sem guardar as posições
+        quantidade = 0
+        for _ in self.iterar(texto, padrao):
+            quantidade += 1
+        return quantidade, self.comparacoes
+
+    def primeiras(self, texto, padrao, k):
+        # As k primeiras ocorrências; a busca para assim que as encontra
+        if k <= 0:
+            # islice não chegaria a iniciar a busca
+            self.comparacoes = 0
+            return [], 0
+        ocorrencias = list(islice(self.iterar(texto, padrao), k))
+        return ocorrencias, self.comparacoes
+
+    def existe(self, texto, padrao):
+        # Para na primeira ocorrência
+        return bool(self.primeiras(texto, padrao, 1)[0])
+
+
+class BuscaComparacao(Busca):
+    def iterar(self, texto, padrao):
+        qntd_comparacoes = 0
+        self.comparacoes = 0
+        self.registrar("=====:: BUSCA BASICA COMPARACOES ::=====\n")
+        # Percorre o texto
+        for i in range(len(texto) - len(padrao) + 1):
+            achou = True
+            # Percorre o padrão
+            for j in range(len(padrao)):
+                # Incrementa a quantidade de comparações
+                qntd_comparacoes += 1
+                # Exibe a comparação
+                self.comparando(texto, i, padrao)
+                # Se os caracteres forem diferentes, sai do loop
+                if padrao[j] != texto[i + j]:
+                    # Se não achou, sai do loop
+                    achou = False
+                    break
+            # Se achou, entrega a posição da ocorrência
+            if achou:
+                self.comparacoes = qntd_comparacoes
+                yield i
+        self.comparacoes = qntd_comparacoes
+
+
+class BuscaKMP(Busca):
+    def prefixo(self, padrao):
+        # Inicializa a lista de prefixos
+        prefixo = [0] * len(padrao)
+        p = 0
+        # Percorre o padrão
+        for i in range(1, len(padrao)):
+            # Se os caracteres forem diferentes
+            while p > 0 and padrao[p] != padrao[i]:
+                # Atualiza o valor de p
+                p = prefixo[p - 1]
+                # Se os caracteres forem iguais
+            if padrao[p] == padrao[i]:
+                p += 1
+                # Atualiza o valor do prefixo
+            prefixo[i] = p
+            # Retorna a lista de prefixos
+        return prefixo
+
+    # Método para buscar o padrão no texto
+    def iterar(self, texto, padrao):
+        prefixo = self.prefixo(padrao)
+        i = 0
+        j = 0
+        comparacoes = 0
+        self.comparacoes = 0
+        self.registrar("\n==== :: BUSCA KMP COMPARACOES ::======\n")
+        # Percorre o texto
+        while i < len(texto):
+            comparacoes += 1
+            self.comparando(texto, i, padrao)
+            # Se os caracteres forem iguais
+            if padrao[j] == texto[i]:
+                i += 1
+                j += 1
+                # Se achou o padrão
+                if j == len(padrao):
+                    # Entrega a posição da ocorrência
+                    self.comparacoes = comparacoes
+                    yield i - j
+                    # Atualiza o valor de j
+                    j = prefixo[j - 1]
+            else:
+                # Se os caracteres forem diferentes
+                if j != 0:
+                    # Atualiza o valor de j
+                    j = prefixo[j - 1]
+                else:
+                    # Atualiza o valor de i
+                    i += 1
+        self.comparacoes = comparacoes
+
+    # Busca sobre uma sequência de blocos de bytes (arquivo lido em partes ou mmap).
+    # Dentro de cada bloco as ocorrências são achadas pelo find do bytes/mmap
+    # (em C); o KMP só roda nos m-1 primeiros bytes do bloco, para terminar
+    # as ocorrências que atravessam a fronteira com o bloco anterior, e nos
+    # m-1 últimos, para calcular o estado j levado para o próximo bloco.
+    # `inicio` e `fim` limitam a busca aos bytes [inicio, fim) da sequência,
+    # sem copiar nada (o find do bytes/mmap aceita os limites); as posições
+    # geradas continuam contadas desde o começo da sequência.
+    def buscar_blocos(self, blocos, padrao, inicio=0, fim=None):
+        if isinstance(padrao, str):
+            padrao = padrao.encode("utf-8")
+        if not padrao:
+            return
+        prefixo = self.prefixo(padrao)
+        m = len(padrao)
+        j = 0
+        deslocamento = 0
+        for bloco in blocos:
+            n = len(bloco)
+            a = max(inicio - deslocamento, 0)
+            limite = n if fim is None else min(fim - deslocamento, n)
+            if a < limite:
+                # Fronteira: continua o KMP do bloco anterior; só entrega as
+                # ocorrências que começaram antes deste bloco (as outras o
+                # find acha logo abaixo)
+                borda = min(a + m - 1, limite)
+                i = a
+                while i < borda:
+                    if padrao[j] == bloco[i]:
+                        i += 1
+                        j += 1
+                        if j == m:
+                            yield deslocamento + i - m
+                            j = prefixo[j - 1]
+                    elif j != 0:
+                        j = prefixo[j - 1]
+                    else:
+                        i += 1
+                # Ocorrências inteiras dentro do bloco
+                i = bloco.find(padrao, a, limite)
+                while i >= 0:
+                    yield deslocamento + i
+                    i = bloco.find(padrao, i + 1, limite)
+                if borda < limite:
+                    # Estado para o próximo bloco: o maior prefixo do padrão
+                    # que termina no fim do bloco, tirado dos m-1 últimos bytes
+                    j = 0
+                    i = limite - (m - 1)
+                    while i < limite:
+                        if padrao[j] == bloco[i]:
+                            i += 1
+                            j += 1
+                        elif j != 0:
+                            j = prefixo[j - 1]
+                        else:
+                            i += 1
+            deslocamento += n
+            if fim is not None and deslocamento >= fim:
+                break
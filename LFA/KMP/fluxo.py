@@ -0,0 +1,60 @@
+# Busca KMP em arquivos grandes, sem interface gráfica.
+# O arquivo é lido em blocos de tamanho fixo (ou mapeado com mmap), então a
+# memória usada não depende do tamanho do arquivo.
+import argparse
+import mmap
+import os
+from itertools import islice
+
+from buscas import BuscaKMP
+
+# Tamanho padrão do bloco de leitura (1 MiB)
+TAMANHO_BLOCO = 1 << 20
+
+
+def ler_blocos(caminho, tamanho_bloco=TAMANHO_BLOCO):
+    # Gera os bytes do arquivo em blocos de tamanho fixo
+    with open(caminho, 'rb') as arquivo:
+        while True:
+            bloco = arquivo.read(tamanho_bloco)
+            if not bloco:
+                break
+            yield bloco
+
+
+def blocos_mmap(caminho):
+    # Gera o arquivo inteiro mapeado em memória como um único bloco
+    with open(caminho, 'rb') as arquivo:
+        if os.fstat(arquivo.fileno()).st_size == 0:
+            return
+        with mmap.mmap(arquivo.fileno(), 0, access=mmap.ACCESS_READ) as mapa:
+            yield mapa
+
+
+def buscar_arquivo(caminho, padrao, tamanho_bloco=TAMANHO_BLOCO, usar_mmap=False):
+    # Gera as posições (em bytes) de cada ocorrência do padrão no arquivo
+    if usar_mmap:
+        blocos = blocos_mmap(caminho)
+    else:
+        blocos = ler_blocos(caminho, tamanho_bloco)
+    return BuscaKMP().buscar_blocos(blocos, padrao)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Busca KMP em arquivos grandes, por blocos.")
+    parser.add_argument("padrao", help="Padrão a ser buscado")
+    parser.add_argument("arquivo", help="Arquivo de texto")
+    parser.add_argument("--bloco", type=int, default=TAMANHO_BLOCO, help="Tamanho do bloco em bytes")
+    parser.add_argument("--mmap", action="store_true", help="Mapear o arquivo com mmap em vez de ler por blocos")
+    parser.add_argument("--contar", action="store_true", help="Só imprime a quantidade de ocorrências")
+    parser.add_argument("--primeiras", type=int, default=None, help="Para depois de K ocorrências")
+    args = parser.parse_args()
+
+    posicoes = buscar_arquivo(args.arquivo, args.padrao, args.bloco, args.mmap)
+    if args.primeiras is not None:
+        posicoes = islice(posicoes, args.primeiras)
+    if args.contar:
+        print(sum(1 for _ in posicoes))
+    else:
+        for posicao in posicoes:
+            print(posicao)
@@ -0,0 +1,80 @@
+# Busca incremental: mantém a lista de ocorrências de um padrão enquanto o
+# texto é editado. Depois de cada edição só o trecho alterado, mais
+# len(padrao) - 1 símbolos de cada lado, é buscado de novo; as ocorrências
+# depois da edição só têm a posição deslocada.
+from bisect import bisect_left
+
+from buscas import BuscaKMP
+
+
+def prefixo_comum(a, b):
+    # Tamanho do maior prefixo comum, por busca binária com comparação de fatias (em C)
+    baixo, alto = 0, min(len(a), len(b))
+    while baixo < alto:
+        meio = (baixo + alto + 1) // 2
+        if a[baixo:meio] == b[baixo:meio]:
+            baixo = meio
+        else:
+            alto = meio - 1
+    return baixo
+
+
+def sufixo_comum(a, b, limite):
+    # Tamanho do maior sufixo comum, sem passar de `limite` símbolos
+    baixo, alto = 0, min(len(a), len(b), limite)
+    while baixo < alto:
+        meio = (baixo + alto + 1) // 2
+        if a[len(a) - meio:len(a) - baixo] == b[len(b) - meio:len(b) - baixo]:
+            baixo = meio
+        else:
+            alto = meio - 1
+    return baixo
+
+
+def trecho_editado(antigo, novo):
+    # Reduz a diferença entre dois textos a uma única edição:
+    # (inicio, quantidade removida, quantidade inserida)
+    inicio = prefixo_comum(antigo, novo)
+    fim = sufixo_comum(antigo, novo, min(len(antigo), len(novo)) - inicio)
+    return inicio, len(antigo) - inicio - fim, len(novo) - inicio - fim
+
+
+class BuscaIncremental:
+    def __init__(self, padrao, motor=None):
+        self.padrao = padrao
+        self.motor = motor or BuscaKMP()
+        self.texto = ""
+        self.ocorrencias = []
+        self.comparacoes = 0
+
+    def buscar_tudo(self, texto):
+        self.texto = texto
+        self.ocorrencias, self.comparacoes = self.motor.buscar(texto, self.padrao)
+        return self.ocorrencias
+
+    def editar(self, inicio, removidos, inseridos, novo_texto):
+        # texto[inicio:inicio + removidos] foi trocado por `inseridos` símbolos
+        m = len(self.padrao)
+        self.texto = novo_texto
+        if m == 0:
+            return self.ocorrencias
+        delta = inseridos - removidos
+        # Ocorrências que terminam antes da edição continuam valendo
+        antes = bisect_left(self.ocorrencias, inicio - m + 1)
+        # Ocorrências que começam depois do trecho removido só são deslocadas
+        depois = bisect_left(self.ocorrencias, inicio + removidos)
+        # Rebusca só a janela que pode conter ocorrências cruzando a edição
+        janela_inicio = max(0, inicio - m + 1)
+        janela_fim = min(len(novo_texto), inicio + inseridos + m - 1)
+        novas, self.comparacoes = self.motor.buscar(novo_texto[janela_inicio:janela_fim], self.padrao)
+        self.ocorrencias = (self.ocorrencias[:antes]
+                            + [janela_inicio + p for p in novas]
+                            + [p + delta for p in self.ocorrencias[depois:]])
+        return self.ocorrencias
+
+    def atualizar(self, novo_texto):
+        # Descobre o trecho editado comparando com o texto anterior
+        inicio, removidos, inseridos = trecho_editado(self.texto, novo_texto)
+        if removidos == 0 and inseridos == 0:
+            return self.ocorrencias
+        return self.editar(inicio, removidos, inseridos, novo_texto)
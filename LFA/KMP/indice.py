@@ -0,0 +1,306 @@
+# Modo índice: o texto é pré-processado uma única vez (vetor de sufixos ou
+# FM-index) e o índice é salvo em disco. Cada busca seguinte custa
+# O(m log n) no vetor de sufixos, ou O(m) para contar no FM-index, sem
+# percorrer o texto de novo.
+import argparse
+import json
+import struct
+from array import array
+from bisect import bisect_left, bisect_right
+from itertools import accumulate
+from operator import ne
+
+from buscas import Busca
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Marcador de fim de texto, menor que qualquer outro símbolo
+SENTINELA = "\0"
+MAGICO_SUFIXOS = b"VSUF"
+MAGICO_FM = b"FMIX"
+VERSAO = 1
+
+
+def construir_vetor_sufixos(texto):
+    # Duplicação de prefixos: ordena os sufixos pelos 2^k primeiros símbolos,
+    # dobrando k até que todos os postos sejam distintos. A chave de cada
+    # sufixo é um único inteiro, posto[i] * (n + 1) + posto[i + k] + 1, sem
+    # tuplas; com NumPy cada rodada é vetorizada
+    n = len(texto)
+    if n == 0:
+        return array('q')
+    if np is not None:
+        return _vetor_sufixos_numpy(texto)
+    alfabeto = {simbolo: i for i, simbolo in enumerate(sorted(set(texto)))}
+    posto = list(map(alfabeto.__getitem__, texto))
+    base = n + 1
+    indices = range(n)
+    k = 1
+    while True:
+        segundo = [p + 1 for p in posto[k:]] + [0] * min(k, n)
+        chave = [p * base + s for p, s in zip(posto, segundo)]
+        sa = sorted(indices, key=chave.__getitem__)
+        ordenadas = list(map(chave.__getitem__, sa))
+        # Posto novo na ordem do vetor: soma de quantas chaves mudaram até ali
+        postos = list(accumulate(map(ne, ordenadas[1:], ordenadas), initial=0))
+        if postos[-1] == n - 1:
+            return array('q', sa)
+        # Inverso da permutação (posição de cada sufixo no vetor), ordenado em C
+        inverso = sorted(indices, key=sa.__getitem__)
+        posto = list(map(postos.__getitem__, inverso))
+        k *= 2
+
+
+def _vetor_sufixos_numpy(texto):
+    n = len(texto)
+    codigos = np.frombuffer(texto.encode("utf-32-le"), dtype=np.uint32)
+    posto = np.unique(codigos, return_inverse=True)[1].astype(np.int64)
+    segundo = np.zeros(n, dtype=np.int64)
+    k = 1
+    while True:
+        segundo[:] = 0
+        if k < n:
+            segundo[:n - k] = posto[k:] + 1
+        chave = posto * (n + 1) + segundo
+        sa = np.argsort(chave, kind="stable")
+        ordenadas = chave[sa]
+        postos = np.zeros(n, dtype=np.int64)
+        np.cumsum(ordenadas[1:] != ordenadas[:-1], out=postos[1:])
+        if postos[-1] == n - 1:
+            resultado = array('q')
+            resultado.frombytes(sa.astype(np.int64).tobytes())
+            return resultado
+        posto[sa] = postos
+        k *= 2
+
+
+def _escrever(arquivo, magico, cabecalho, *blocos):
+    # Formato: mágico, tamanho do cabeçalho JSON, cabeçalho e blocos binários
+    dados = json.dumps(cabecalho).encode("utf-8")
+    arquivo.write(magico)
+    arquivo.write(struct.pack("<I", len(dados)))
+    arquivo.write(dados)
+    for bloco in blocos:
+        arquivo.write(bloco)
+
+
+def _ler_cabecalho(arquivo, magico):
+    if arquivo.read(4) != magico:
+        raise ValueError("Arquivo de índice inválido.")
+    (tamanho,) = struct.unpack("<I", arquivo.read(4))
+    cabecalho = json.loads(arquivo.read(tamanho).decode("utf-8"))
+    if cabecalho.get("versao") != VERSAO:
+        raise ValueError(f"Versão de índice não suportada: {cabecalho.get('versao')}")
+    return cabecalho
+
+
+def _ler_array(arquivo, quantidade):
+    valores = array('q')
+    valores.fromfile(arquivo, quantidade)
+    return valores
+
+
+class IndiceSufixos:
+    # Vetor de sufixos: os sufixos do texto em ordem lexicográfica.
+    # Ocorrências de um padrão formam um intervalo contíguo do vetor.
+    def __init__(self, texto, sa=None):
+        self.texto = texto
+        self.sa = sa if sa is not None else construir_vetor_sufixos(texto)
+
+    def intervalo(self, padrao):
+        # Duas buscas binárias: O(m log n) comparações de símbolos
+        m = len(padrao)
+        prefixo = lambda i: self.texto[i:i + m]
+        inicio = bisect_left(self.sa, padrao, key=prefixo)
+        fim = bisect_right(self.sa, padrao, key=prefixo)
+        return inicio, fim
+
+    def contar(self, padrao):
+        inicio, fim = self.intervalo(padrao)
+        return fim - inicio
+
+    def localizar(self, padrao):
+        inicio, fim = self.intervalo(padrao)
+        return sorted(self.sa[inicio:fim])
+
+    def salvar(self, caminho):
+        texto = self.texto.encode("utf-8")
+        with open(caminho, 'wb') as arquivo:
+            _escrever(arquivo, MAGICO_SUFIXOS,
+                      {"versao": VERSAO, "n": len(self.sa), "bytes_texto": len(texto)},
+                      texto, self.sa.tobytes())
+
+    @classmethod
+    def carregar(cls, caminho):
+        with open(caminho, 'rb') as arquivo:
+            cabecalho = _ler_cabecalho(arquivo, MAGICO_SUFIXOS)
+            texto = arquivo.read(cabecalho["bytes_texto"]).decode("utf-8")
+            sa = _ler_array(arquivo, cabecalho["n"])
+        return cls(texto, sa)
+
+
+class IndiceFM:
+    # FM-index: transformada de Burrows-Wheeler (BWT) do texto, a tabela C
+    # (quantos símbolos menores que c existem) e tabelas de ocorrência
+    # amostradas a cada `passo_occ` posições. Contar usa só a BWT; localizar
+    # usa também o vetor de sufixos amostrado a cada `passo_sa` posições do texto.
+    def __init__(self, bwt, c, occ, amostras_sa, passo_occ, passo_sa):
+        self.bwt = bwt
+        self.c = c
+        self.occ = occ
+        self.amostras_sa = amostras_sa
+        self.passo_occ = passo_occ
+        self.passo_sa = passo_sa
+
+    @classmethod
+    def construir(cls, texto, passo_occ=64, passo_sa=32):
+        if SENTINELA in texto:
+            raise ValueError("O texto não pode conter o caractere nulo.")
+        texto = texto + SENTINELA
+        sa = construir_vetor_sufixos(texto)
+        bwt = "".join(texto[i - 1] for i in sa)
+        # Tabela C: posição do primeiro sufixo que começa com cada símbolo
+        contagem = {}
+        for simbolo in bwt:
+            contagem[simbolo] = contagem.get(simbolo, 0) + 1
+        c = {}
+        total = 0
+        for simbolo in sorted(contagem):
+            c[simbolo] = total
+            total += contagem[simbolo]
+        # Pontos de controle: ocorrências de cada símbolo em bwt[:k * passo_occ]
+        occ = {simbolo: array('q', [0]) for simbolo in c}
+        acumulado = dict.fromkeys(c, 0)
+        for inicio in range(0, len(bwt), passo_occ):
+            for simbolo in c:
+                acumulado[simbolo] += bwt.count(simbolo, inicio, inicio + passo_occ)
+                occ[simbolo].append(acumulado[simbolo])
+        # Amostras do vetor de sufixos: linha da BWT -> posição no texto
+        amostras_sa = {linha: pos for linha, pos in enumerate(sa) if pos % passo_sa == 0}
+        return cls(bwt, c, occ, amostras_sa, passo_occ, passo_sa)
+
+    def ocorrencias_ate(self, simbolo, i):
+        # Quantas vezes o símbolo aparece em bwt[:i]: ponto de controle + resto
+        bloco = i // self.passo_occ
+        return self.occ[simbolo][bloco] + self.bwt.count(simbolo, bloco * self.passo_occ, i)
+
+    def intervalo(self, padrao):
+        # Busca reversa: um passo por símbolo do padrão, O(m)
+        inicio, fim = 0, len(self.bwt)
+        for simbolo in reversed(padrao):
+            if simbolo not in self.c:
+                return 0, 0
+            inicio = self.c[simbolo] + self.ocorrencias_ate(simbolo, inicio)
+            fim = self.c[simbolo] + self.ocorrencias_ate(simbolo, fim)
+            if inicio >= fim:
+                return 0, 0
+        return inicio, fim
+
+    def contar(self, padrao):
+        inicio, fim = self.intervalo(padrao)
+        return fim - inicio
+
+    def posicao(self, linha):
+        # Anda pela função LF até uma linha amostrada e soma os passos dados
+        passos = 0
+        while linha not in self.amostras_sa:
+            simbolo = self.bwt[linha]
+            linha = self.c[simbolo] + self.ocorrencias_ate(simbolo, linha)
+            passos += 1
+        return self.amostras_sa[linha] + passos
+
+    def localizar(self, padrao):
+        inicio, fim = self.intervalo(padrao)
+        return sorted(self.posicao(linha) for linha in range(inicio, fim))
+
+    def salvar(self, caminho):
+        bwt = self.bwt.encode("utf-8")
+        simbolos = sorted(self.c)
+        linhas = array('q', sorted(self.amostras_sa))
+        posicoes = array('q', (self.amostras_sa[linha] for linha in linhas))
+        cabecalho = {
+            "versao": VERSAO,
+            "bytes_bwt": len(bwt),
+            "simbolos": simbolos,
+            "c": [self.c[s] for s in simbolos],
+            "pontos_occ": len(self.occ[simbolos[0]]) if simbolos else 0,
+            "amostras_sa": len(linhas),
+            "passo_occ": self.passo_occ,
+            "passo_sa": self.passo_sa,
+        }
+        with open(caminho, 'wb') as arquivo:
+            _escrever(arquivo, MAGICO_FM, cabecalho, bwt,
+                      *(self.occ[s].tobytes() for s in simbolos),
+                      linhas.tobytes(), posicoes.tobytes())
+
+    @classmethod
+    def carregar(cls, caminho):
+        with open(caminho, 'rb') as arquivo:
+            cabecalho = _ler_cabecalho(arquivo, MAGICO_FM)
+            bwt = arquivo.read(cabecalho["bytes_bwt"]).decode("utf-8")
+            simbolos = cabecalho["simbolos"]
+            c = dict(zip(simbolos, cabecalho["c"]))
+            occ = {s: _ler_array(arquivo, cabecalho["pontos_occ"]) for s in simbolos}
+            linhas = _ler_array(arquivo, cabecalho["amostras_sa"])
+            posicoes = _ler_array(arquivo, cabecalho["amostras_sa"])
+        return cls(bwt, c, occ, dict(zip(linhas, posicoes)),
+                   cabecalho["passo_occ"], cabecalho["passo_sa"])
+
+
+class BuscaIndexada(Busca):
+    # Reaproveita o FM-index enquanto o texto não muda; só o primeiro clique paga a construção
+    def __init__(self, rastro=None):
+        super().__init__(rastro)
+        self.texto = None
+        self.indice = None
+
+    def preparar(self, texto):
+        if self.indice is None or texto != self.texto:
+            self.texto = texto
+            self.indice = IndiceFM.construir(texto)
+        return self.indice
+
+    def iterar(self, texto, padrao):
+        indice = self.preparar(texto)
+        self.registrar("\n==== :: BUSCA INDEXADA (FM-INDEX) ::======\n")
+        # Cada símbolo do padrão consulta a tabela de ocorrências duas vezes
+        self.comparacoes = 2 * len(padrao)
+        return iter(indice.localizar(padrao))
+
+    def contar(self, texto, padrao):
+        # O FM-index conta sem localizar as ocorrências
+        return self.preparar(texto).contar(padrao), 2 * len(padrao)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Constrói e consulta índices de texto.")
+    comandos = parser.add_subparsers(dest="comando", required=True)
+    construir = comandos.add_parser("construir", help="Constrói o índice de um arquivo de texto")
+    construir.add_argument("arquivo")
+    construir.add_argument("indice")
+    construir.add_argument("--tipo", choices=["fm", "sufixos"], default="fm")
+    consultar = comandos.add_parser("buscar", help="Busca padrões em um índice salvo")
+    consultar.add_argument("indice")
+    consultar.add_argument("padroes", nargs="+")
+    consultar.add_argument("--contar", action="store_true", help="Só conta as ocorrências")
+    args = parser.parse_args()
+
+    if args.comando == "construir":
+        with open(args.arquivo, 'r', encoding='utf-8') as arquivo:
+            texto = arquivo.read()
+        if args.tipo == "fm":
+            IndiceFM.construir(texto).salvar(args.indice)
+        else:
+            IndiceSufixos(texto).salvar(args.indice)
+    else:
+        with open(args.indice, 'rb') as arquivo:
+            magico = arquivo.read(4)
+        indice = (IndiceFM if magico == MAGICO_FM else IndiceSufixos).carregar(args.indice)
+        for padrao in args.padroes:
+            if args.contar:
+                print(f"{padrao}: {indice.contar(padrao)}")
+            else:
+                print(f"{padrao}: {indice.localizar(padrao)}")
@@ -0,0 +1,136 @@
+# Motores de busca de vários padrões em uma única passada pelo texto.
+from collections import deque
+
+from buscas import Busca
+
+
+class BuscaAhoCorasick(Busca):
+    # Generalização do KMP para um conjunto de padrões: a tabela de prefixos
+    # vira uma árvore de prefixos (goto) com ligações de falha entre os nós.
+
+    def compilar(self, padroes):
+        # Nó 0 é a raiz; cada nó tem suas transições, ligação de falha e saídas
+        self.goto = [{}]
+        self.falha = [0]
+        self.saidas = [[]]
+        self.padroes = list(dict.fromkeys(padroes))
+        # Monta a árvore de prefixos com todos os padrões
+        for padrao in self.padroes:
+            if not padrao:
+                continue
+            no = 0
+            for simbolo in padrao:
+                proximo = self.goto[no].get(simbolo)
+                if proximo is None:
+                    proximo = len(self.goto)
+                    self.goto[no][simbolo] = proximo
+                    self.goto.append({})
+                    self.falha.append(0)
+                    self.saidas.append([])
+                no = proximo
+            self.saidas[no].append(padrao)
+        # Calcula as ligações de falha em largura, como o prefixo do KMP:
+        # a falha de um nó é o maior sufixo próprio que também é prefixo de algum padrão
+        fila = deque(self.goto[0].values())
+        while fila:
+            no = fila.popleft()
+            for simbolo, filho in self.goto[no].items():
+                fila.append(filho)
+                f = self.falha[no]
+                while f > 0 and simbolo not in self.goto[f]:
+                    f = self.falha[f]
+                self.falha[filho] = self.goto[f].get(simbolo, 0)
+                # Herda as saídas do nó de falha (padrões que são sufixo deste)
+                self.saidas[filho] = self.saidas[filho] + self.saidas[self.falha[filho]]
+        return self
+
+    def iterar(self, texto, padroes):
+        self.compilar(padroes)
+        return self.iterar_compilado(texto)
+
+    # Busca com o autômato já compilado, para reutilizar o mesmo conjunto de padrões
+    def iterar_compilado(self, texto):
+        goto = self.goto
+        falha = self.falha
+        saidas = self.saidas
+        comparacoes = 0
+        self.comparacoes = 0
+        self.registrar("\n==== :: BUSCA AHO-CORASICK ::======\n")
+        no = 0
+        for i, simbolo in enumerate(texto):
+            # Segue as ligações de falha até achar uma transição para o símbolo
+            while True:
+                comparacoes += 1
+                proximo = goto[no].get(simbolo)
+                if proximo is not None:
+                    no = proximo
+                    break
+                if no == 0:
+                    break
+                no = falha[no]
+            # Reporta todos os padrões que terminam nesta posição
+            for padrao in saidas[no]:
+                self.comparacoes = comparacoes
+                yield (padrao, i - len(padrao) + 1)
+        self.comparacoes = comparacoes
+
+
+class BuscaRabinKarp(Busca):
+    # Rabin-Karp para muitos padrões do mesmo tamanho: um hash deslizante
+    # percorre o texto e cada janela é procurada num dicionário de hashes dos
+    # padrões. Só as janelas com hash conhecido são comparadas de fato, então
+    # o custo quase não depende de quantos padrões foram carregados.
+    BASE = 256
+    MODULO = (1 << 61) - 1
+
+    def compilar(self, padroes):
+        padroes = [p for p in dict.fromkeys(padroes) if p]
+        tamanhos = {len(p) for p in padroes}
+        if len(tamanhos) > 1:
+            raise ValueError("Todos os padrões do Rabin-Karp devem ter o mesmo tamanho.")
+        self.m = tamanhos.pop() if tamanhos else 0
+        # Hash -> padrões com esse hash (colisões são resolvidas na verificação)
+        self.hashes = {}
+        for padrao in padroes:
+            self.hashes.setdefault(self.hash(padrao), []).append(padrao)
+        # Peso do símbolo que sai da janela: BASE^(m-1)
+        self.potencia = pow(self.BASE, self.m - 1, self.MODULO) if self.m else 0
+        return self
+
+    def hash(self, janela):
+        h = 0
+        for simbolo in janela:
+            h = (h * self.BASE + ord(simbolo)) % self.MODULO
+        return h
+
+    def iterar(self, texto, padroes):
+        self.compilar(padroes)
+        return self.iterar_compilado(texto)
+
+    # Busca com os padrões já compilados
+    def iterar_compilado(self, texto):
+        m = self.m
+        comparacoes = 0
+        self.comparacoes = 0
+        if m == 0 or len(texto) < m:
+            return
+        self.registrar("\n==== :: BUSCA RABIN-KARP ::======\n")
+        base = self.BASE
+        modulo = self.MODULO
+        potencia = self.potencia
+        hashes = self.hashes
+        h = self.hash(texto[:m])
+        for i in range(len(texto) - m + 1):
+            if i > 0:
+                # Tira o símbolo que saiu da janela e acrescenta o que entrou
+                h = ((h - ord(texto[i - 1]) * potencia) * base + ord(texto[i + m - 1])) % modulo
+            comparacoes += 1
+            candidatos = hashes.get(h)
+            if candidatos is not None:
+                janela = texto[i:i + m]
+                for padrao in candidatos:
+                    comparacoes += m
+                    if padrao == janela:
+                        self.comparacoes = comparacoes
+                        yield (padrao, i)
+        self.comparacoes = comparacoes
@@ -0,0 +1,60 @@
+# Busca KMP paralela: o arquivo é dividido em trechos que se sobrepõem em
+# len(padrao) - 1 bytes e cada trecho é buscado por um processo diferente.
+# Os processos abrem o arquivo com mmap por conta própria, então só o
+# caminho e os limites do trecho são enviados para eles.
+import argparse
+import mmap
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from buscas import BuscaKMP
+
+# Trechos por processo, para equilibrar a carga quando uns terminam antes
+TRECHOS_POR_PROCESSO = 4
+
+
+def dividir(tamanho, m, quantidade):
+    # Gera (inicio, fim) de cada trecho; o trecho lido vai até fim + m - 1
+    passo = max(m, -(-tamanho // quantidade))
+    for inicio in range(0, tamanho, passo):
+        yield inicio, min(inicio + passo, tamanho)
+
+
+def buscar_trecho(caminho, padrao, inicio, fim):
+    # Executado em cada processo: mapeia o arquivo e busca direto no mapa,
+    # limitado ao trecho, sem copiar os bytes
+    with open(caminho, 'rb') as arquivo:
+        with mmap.mmap(arquivo.fileno(), 0, access=mmap.ACCESS_READ) as mapa:
+            limite = min(fim + len(padrao) - 1, len(mapa))
+            # Cada trecho só fica com as ocorrências que começam dentro dele; as que
+            # começam na sobreposição pertencem ao trecho seguinte, o que descarta as duplicadas
+            return [p for p in BuscaKMP().buscar_blocos([mapa], padrao, inicio, limite) if p < fim]
+
+
+def buscar_paralelo(caminho, padrao, processos=None):
+    # Retorna a lista ordenada das posições (em bytes) de cada ocorrência
+    if isinstance(padrao, str):
+        padrao = padrao.encode("utf-8")
+    tamanho = os.path.getsize(caminho)
+    if not padrao or tamanho < len(padrao):
+        return []
+    processos = processos or os.cpu_count() or 1
+    trechos = list(dividir(tamanho, len(padrao), processos * TRECHOS_POR_PROCESSO))
+    with ProcessPoolExecutor(max_workers=processos) as executor:
+        futuros = [executor.submit(buscar_trecho, caminho, padrao, inicio, fim) for inicio, fim in trechos]
+        # Os trechos estão em ordem e não se repetem, então basta concatenar
+        ocorrencias = []
+        for futuro in futuros:
+            ocorrencias.extend(futuro.result())
+    return ocorrencias
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Busca KMP paralela em um arquivo.")
+    parser.add_argument("padrao", help="Padrão a ser buscado")
+    parser.add_argument("arquivo", help="Arquivo de texto")
+    parser.add_argument("--processos", type=int, default=None, help="Número de processos (padrão: núcleos da CPU)")
+    args = parser.parse_args()
+
+    for posicao in buscar_paralelo(args.arquivo, args.padrao, args.processos):
+        print(posicao)
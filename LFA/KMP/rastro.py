@@ -0,0 +1,58 @@
+# Rastro das comparações feitas pelos motores de busca.
+# As mensagens ficam em um buffer circular de tamanho limitado e são escritas
+# de uma vez só no fim da busca (no widget ou em um arquivo), para que o tempo
+# medido seja o do algoritmo e não o da interface.
+from collections import deque
+
+# Níveis de rastro
+DESLIGADO = 0
+AMOSTRADO = 1
+COMPLETO = 2
+
+NIVEIS = {"Desligado": DESLIGADO, "Amostrado": AMOSTRADO, "Completo": COMPLETO}
+
+
+class Rastro:
+    def __init__(self, nivel=COMPLETO, intervalo=100, capacidade=10000):
+        self.nivel = nivel
+        # No nível amostrado, registra uma a cada `intervalo` comparações
+        self.intervalo = max(1, intervalo)
+        self.mensagens = deque(maxlen=capacidade)
+        self.comparacoes = 0
+        self.descartadas = 0
+
+    def amostrar(self):
+        # Conta mais uma comparação e diz se ela deve ser registrada
+        if self.nivel == DESLIGADO:
+            return False
+        self.comparacoes += 1
+        return self.nivel == COMPLETO or self.comparacoes % self.intervalo == 0
+
+    def adicionar(self, mensagem):
+        if self.nivel == DESLIGADO:
+            return
+        # Buffer cheio: a mensagem mais antiga é descartada
+        if len(self.mensagens) == self.mensagens.maxlen:
+            self.descartadas += 1
+        self.mensagens.append(mensagem)
+
+    def texto(self):
+        aviso = ""
+        if self.descartadas:
+            aviso = f"... {self.descartadas} mensagens antigas descartadas ...\n"
+        return aviso + "".join(self.mensagens)
+
+    def limpar(self):
+        self.mensagens.clear()
+        self.comparacoes = 0
+        self.descartadas = 0
+
+    def descarregar(self, escrever):
+        # Escreve todo o buffer com uma única chamada (ex.: output_text.insert)
+        if self.mensagens:
+            escrever(self.texto())
+        self.limpar()
+
+    def salvar(self, caminho):
+        with open(caminho, 'a', encoding='utf-8') as arquivo:
+            self.descarregar(arquivo.write)
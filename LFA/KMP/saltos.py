@@ -0,0 +1,233 @@
+# Motores de busca com saltos: comparam o padrão a partir de uma das pontas
+# e usam tabelas pré-calculadas para pular posições do texto que não podem
+# conter ocorrência. Em padrões longos a maior parte do texto nem é lida.
+from buscas import Busca, BuscaKMP
+
+
+def tabela_mau_caractere(padrao):
+    # Distância da última ocorrência de cada símbolo (exceto o último) até o fim do padrão
+    m = len(padrao)
+    tabela = {}
+    for i in range(m - 1):
+        tabela[padrao[i]] = m - 1 - i
+    return tabela
+
+
+def sufixos(padrao):
+    # sufixos[i] = tamanho do maior sufixo do padrão que termina na posição i
+    m = len(padrao)
+    suff = [0] * m
+    suff[m - 1] = m
+    g = m - 1
+    f = 0
+    for i in range(m - 2, -1, -1):
+        if i > g and suff[i + m - 1 - f] < i - g:
+            suff[i] = suff[i + m - 1 - f]
+        else:
+            if i < g:
+                g = i
+            f = i
+            while g >= 0 and padrao[g] == padrao[g + m - 1 - f]:
+                g -= 1
+            suff[i] = f - g
+    return suff
+
+
+def tabela_bom_sufixo(padrao):
+    # Deslocamento seguro quando o sufixo padrao[i+1:] já casou e padrao[i] falhou
+    m = len(padrao)
+    suff = sufixos(padrao)
+    tabela = [m] * m
+    j = 0
+    for i in range(m - 1, -1, -1):
+        if suff[i] == i + 1:
+            while j < m - 1 - i:
+                if tabela[j] == m:
+                    tabela[j] = m - 1 - i
+                j += 1
+    for i in range(m - 1):
+        tabela[m - 1 - suff[i]] = m - 1 - i
+    return tabela
+
+
+class BuscaBoyerMoore(Busca):
+    def iterar(self, texto, padrao):
+        m = len(padrao)
+        n = len(texto)
+        comparacoes = 0
+        self.comparacoes = 0
+        if m == 0:
+            return
+        mau_caractere = tabela_mau_caractere(padrao)
+        bom_sufixo = tabela_bom_sufixo(padrao)
+        self.registrar("\n==== :: BUSCA BOYER-MOORE COMPARACOES ::======\n")
+        j = 0
+        while j <= n - m:
+            self.comparando(texto, j, padrao)
+            # Compara da direita para a esquerda
+            i = m - 1
+            while i >= 0:
+                comparacoes += 1
+                if padrao[i] != texto[i + j]:
+                    break
+                i -= 1
+            if i < 0:
+                self.comparacoes = comparacoes
+                yield j
+                j += bom_sufixo[0]
+            else:
+                # Maior salto entre a regra do bom sufixo e a do mau caractere
+                j += max(bom_sufixo[i], mau_caractere.get(texto[i + j], m) - m + 1 + i)
+        self.comparacoes = comparacoes
+
+
+class BuscaHorspool(Busca):
+    def iterar(self, texto, padrao):
+        m = len(padrao)
+        n = len(texto)
+        comparacoes = 0
+        self.comparacoes = 0
+        if m == 0:
+            return
+        mau_caractere = tabela_mau_caractere(padrao)
+        self.registrar("\n==== :: BUSCA HORSPOOL COMPARACOES ::======\n")
+        j = 0
+        while j <= n - m:
+            self.comparando(texto, j, padrao)
+            ultimo = texto[j + m - 1]
+            # Compara primeiro o último símbolo da janela, depois o resto
+            i = m - 1
+            while i >= 0:
+                comparacoes += 1
+                if padrao[i] != texto[j + i]:
+                    break
+                i -= 1
+            if i < 0:
+                self.comparacoes = comparacoes
+                yield j
+            # O salto depende só do último símbolo da janela
+            j += mau_caractere.get(ultimo, m)
+        self.comparacoes = comparacoes
+
+
+def sufixo_maximo(padrao, invertido):
+    # Maior sufixo do padrão na ordem lexicográfica (ou na ordem inversa) e seu período
+    m = len(padrao)
+    ms = -1
+    j = 0
+    k = p = 1
+    while j + k < m:
+        a = padrao[j + k]
+        b = padrao[ms + k]
+        if (a > b) if invertido else (a < b):
+            j += k
+            k = 1
+            p = j - ms
+        elif a == b:
+            if k != p:
+                k += 1
+            else:
+                j += p
+                k = 1
+        else:
+            ms = j
+            j = ms + 1
+            k = p = 1
+    return ms, p
+
+
+class BuscaDoisSentidos(Busca):
+    # Algoritmo Two-Way (Crochemore-Perrin): divide o padrão em uma fatoração
+    # crítica, compara a metade direita da esquerda para a direita e depois a
+    # metade esquerda no sentido oposto. Tempo linear com memória constante.
+    def iterar(self, texto, padrao):
+        m = len(padrao)
+        n = len(texto)
+        comparacoes = 0
+        self.comparacoes = 0
+        if m == 0:
+            return
+        self.registrar("\n==== :: BUSCA TWO-WAY COMPARACOES ::======\n")
+        # Fatoração crítica
+        ms1, p1 = sufixo_maximo(padrao, False)
+        ms2, p2 = sufixo_maximo(padrao, True)
+        if ms1 > ms2:
+            corte, periodo = ms1, p1
+        else:
+            corte, periodo = ms2, p2
+        j = 0
+        if padrao[:corte + 1] == padrao[periodo:periodo + corte + 1]:
+            # Padrão periódico: lembra quanto do prefixo já casou no salto anterior
+            memoria = -1
+            while j <= n - m:
+                self.comparando(texto, j, padrao)
+                i = max(corte, memoria) + 1
+                while i < m:
+                    comparacoes += 1
+                    if padrao[i] != texto[i + j]:
+                        break
+                    i += 1
+                if i >= m:
+                    i = corte
+                    while i > memoria:
+                        comparacoes += 1
+                        if padrao[i] != texto[i + j]:
+                            break
+                        i -= 1
+                    if i <= memoria:
+                        self.comparacoes = comparacoes
+                        yield j
+                    j += periodo
+                    memoria = m - periodo - 1
+                else:
+                    j += i - corte
+                    memoria = -1
+        else:
+            periodo = max(corte + 1, m - corte - 1) + 1
+            while j <= n - m:
+                self.comparando(texto, j, padrao)
+                i = corte + 1
+                while i < m:
+                    comparacoes += 1
+                    if padrao[i] != texto[i + j]:
+                        break
+                    i += 1
+                if i >= m:
+                    i = corte
+                    while i >= 0:
+                        comparacoes += 1
+                        if padrao[i] != texto[i + j]:
+                            break
+                        i -= 1
+                    if i < 0:
+                        self.comparacoes = comparacoes
+                        yield j
+                    j += periodo
+                else:
+                    j += i - corte
+        self.comparacoes = comparacoes
+
+
+def tamanho_alfabeto(texto, amostra=65536):
+    # Estima o tamanho do alfabeto pelos símbolos distintos no início do texto
+    return len(set(texto[:amostra]))
+
+
+def escolher_busca(padrao, alfabeto, rastro=None):
+    # Escolhe o motor pelo tamanho do padrão e do alfabeto:
+    # - padrões muito curtos quase não permitem saltos, então o KMP basta;
+    # - padrões muito periódicos (ex.: "abababab") levam o Boyer-Moore ao pior
+    #   caso quadrático, e o Two-Way garante tempo linear;
+    # - alfabetos pequenos (ex.: DNA) repetem sufixos, e a regra do bom sufixo
+    #   do Boyer-Moore compensa;
+    # - alfabetos grandes (texto em linguagem natural) saltam quase sempre pelo
+    #   mau caractere, e o Horspool faz isso com menos trabalho por janela.
+    m = len(padrao)
+    if m <= 2:
+        return BuscaKMP(rastro=rastro)
+    periodo = m - BuscaKMP().prefixo(padrao)[-1]
+    if periodo <= m // 2:
+        return BuscaDoisSentidos(rastro=rastro)
+    if alfabeto <= 4:
+        return BuscaBoyerMoore(rastro=rastro)
+    return BuscaHorspool(rastro=rastro)
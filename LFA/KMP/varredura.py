@@ -0,0 +1,91 @@
+# Busca de um padrão em todos os arquivos de uma pasta (e subpastas).
+# Os arquivos são lidos por um conjunto de threads e os resultados saem à
+# medida que cada arquivo termina, sem esperar a pasta inteira.
+import argparse
+import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from time import perf_counter
+
+from buscas import BuscaKMP
+from fluxo import ler_blocos
+
+# Bytes lidos do início do arquivo para decidir se ele é binário
+AMOSTRA_BINARIO = 8192
+TRABALHADORES = 8
+
+
+def eh_binario(caminho):
+    # Arquivos com byte nulo no início são tratados como binários e ignorados
+    with open(caminho, 'rb') as arquivo:
+        return b"\0" in arquivo.read(AMOSTRA_BINARIO)
+
+
+def listar_arquivos(raiz):
+    for pasta, _, arquivos in os.walk(raiz):
+        for nome in sorted(arquivos):
+            yield os.path.join(pasta, nome)
+
+
+def buscar_em_arquivo(caminho, padrao, tamanho_maximo):
+    # Retorna (caminho, ocorrencias, bytes lidos, motivo); motivo indica por que foi ignorado
+    try:
+        tamanho = os.path.getsize(caminho)
+        if tamanho_maximo is not None and tamanho > tamanho_maximo:
+            return caminho, [], 0, "grande demais"
+        if eh_binario(caminho):
+            return caminho, [], 0, "binário"
+        # KMP por blocos: a parte sem casamento é pulada com bytes.find, em C
+        ocorrencias = list(BuscaKMP().buscar_blocos(ler_blocos(caminho), padrao))
+        return caminho, ocorrencias, tamanho, None
+    except OSError as e:
+        return caminho, [], 0, f"erro: {e}"
+
+
+class Varredura:
+    def __init__(self, trabalhadores=TRABALHADORES, tamanho_maximo=None):
+        self.trabalhadores = trabalhadores
+        self.tamanho_maximo = tamanho_maximo
+        self.arquivos = 0
+        self.ignorados = 0
+        self.bytes_lidos = 0
+        self.tempo = 0.0
+
+    def buscar(self, raiz, padrao):
+        # Gera os resultados de cada arquivo assim que ficam prontos
+        if isinstance(padrao, str):
+            padrao = padrao.encode("utf-8")
+        t0 = perf_counter()
+        with ThreadPoolExecutor(max_workers=self.trabalhadores) as executor:
+            futuros = [executor.submit(buscar_em_arquivo, caminho, padrao, self.tamanho_maximo)
+                       for caminho in listar_arquivos(raiz)]
+            for futuro in as_completed(futuros):
+                caminho, ocorrencias, lidos, motivo = futuro.result()
+                if motivo is None:
+                    self.arquivos += 1
+                    self.bytes_lidos += lidos
+                else:
+                    self.ignorados += 1
+                self.tempo = perf_counter() - t0
+                yield caminho, ocorrencias, motivo
+
+    def resumo(self):
+        mb_por_s = (self.bytes_lidos / 1e6) / self.tempo if self.tempo else 0.0
+        return (f"{self.arquivos} arquivos buscados, {self.ignorados} ignorados, "
+                f"{self.bytes_lidos} bytes em {self.tempo:.3f} s ({mb_por_s:.2f} MB/s)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Busca um padrão em todos os arquivos de uma pasta.")
+    parser.add_argument("padrao", help="Padrão a ser buscado")
+    parser.add_argument("pasta", help="Pasta raiz da busca")
+    parser.add_argument("--threads", type=int, default=TRABALHADORES)
+    parser.add_argument("--tamanho-maximo", type=int, default=None, help="Ignora arquivos maiores que este número de bytes")
+    args = parser.parse_args()
+
+    varredura = Varredura(args.threads, args.tamanho_maximo)
+    for caminho, ocorrencias, motivo in varredura.buscar(args.pasta, args.padrao):
+        if motivo is not None:
+            print(f"{caminho}: ignorado ({motivo})")
+        elif ocorrencias:
+            print(f"{caminho}: {len(ocorrencias)} ocorrências {ocorrencias}")
+    print(varredura.resumo())
@@ -0,0 +1,64 @@
+# Compilação de um Automato (determinístico ou não) em um AFD com tabela de
+# transições densa. Estados e símbolos viram inteiros pequenos e a tabela é
+# um único array plano: a transição de (estado, símbolo) fica na posição
+# estado * quantidade_de_simbolos + símbolo.
+from array import array
+from collections import deque
+
+
+class AFDCompilado:
+    def __init__(self, simbolos, tabela, inicial, finais, conjuntos=None):
+        # simbolos: símbolo -> índice da coluna
+        self.simbolos = simbolos
+        self.k = len(simbolos)
+        self.tabela = tabela
+        self.inicial = inicial
+        # finais[estado] == 1 se o estado é de aceitação
+        self.finais = finais
+        # Conjunto de estados do Automato original que cada estado representa
+        self.conjuntos = conjuntos
+
+    @property
+    def quantidade_estados(self):
+        return len(self.finais)
+
+    def proximo(self, estado, simbolo):
+        return self.tabela[estado * self.k + self.simbolos[simbolo]]
+
+    def aceita(self, cadeia):
+        # Um acesso à tabela por símbolo; símbolo fora do alfabeto rejeita
+        tabela = self.tabela
+        simbolos = self.simbolos
+        k = self.k
+        estado = self.inicial
+        for simbolo in cadeia:
+            coluna = simbolos.get(simbolo)
+            if coluna is None:
+                return False
+            estado = tabela[estado * k + coluna]
+        return self.finais[estado] == 1
+
+
+def compilar(automato):
+    # Construção de subconjuntos: cada estado do AFD é um conjunto de estados
+    # do Automato, criado só quando alcançável a partir do estado inicial
+    alfabeto = sorted(automato.alfabeto())
+    simbolos = {simbolo: i for i, simbolo in enumerate(alfabeto)}
+    # Com transições vazias, cada conjunto já inclui o seu fecho-ε
+    inicial = frozenset(automato.estados_iniciais())
+    indices = {inicial: 0}
+    conjuntos = [inicial]
+    tabela = array('i')
+    fila = deque([inicial])
+    while fila:
+        conjunto = fila.popleft()
+        # As linhas da tabela são preenchidas na mesma ordem dos índices
+        for simbolo in alfabeto:
+            destino = frozenset(automato.proximo_estado(conjunto, simbolo))
+            if destino not in indices:
+                indices[destino] = len(conjuntos)
+                conjuntos.append(destino)
+                fila.append(destino)
+            tabela.append(indices[destino])
+    finais = array('b', (1 if conjunto & automato.estados_finais else 0 for conjunto in conjuntos))
+    return AFDCompilado(simbolos, tabela, 0, finais, conjuntos)
@@ -0,0 +1,108 @@
+# AFD preguiçoso (como no RE2): os estados do AFD, que são conjuntos de
+# estados do Automato, só são criados quando aparecem na entrada, e cada
+# transição (conjunto, símbolo) -> conjunto fica num cache LRU de tamanho
+# limitado. Se o cache passa a errar demais (estados demais para caber),
+# a simulação passa para o AFN em bits (uma máscara de sucessores por
+# estado e símbolo), e de tempos em tempos tenta o cache de novo.
+from collections import OrderedDict
+
+from afn_bits import AFNBits
+
+
+class AFDPreguicoso:
+    def __init__(self, automato, capacidade=10000, janela=1000, taxa_minima=0.5, reavaliar=None):
+        self.automato = automato
+        self.capacidade = capacidade
+        # A cada `janela` consultas ao cache, verifica se a taxa de acertos caiu
+        # abaixo do mínimo. A janela continua de uma cadeia para a outra, então
+        # muitas cadeias curtas também são avaliadas
+        self.janela = janela
+        self.taxa_minima = taxa_minima
+        self.consultas_janela = 0
+        self.acertos_antes_janela = 0
+        # Depois de cair para o AFN, quantos símbolos ficam nele antes de tentar o cache de novo
+        self.reavaliar = reavaliar if reavaliar is not None else 100 * janela
+        self.usando_afn = False
+        self.simbolos_ate_reavaliar = 0
+        self.cache = OrderedDict()
+        self.inicial = frozenset(automato.estados_iniciais())
+        self.afn = None
+        # Contadores
+        self.acertos = 0
+        self.falhas = 0
+        self.expulsoes = 0
+        self.quedas_para_afn = 0
+        self.simbolos_afn = 0
+
+    @property
+    def taxa_acerto(self):
+        total = self.acertos + self.falhas
+        return self.acertos / total if total else 0.0
+
+    def contadores(self):
+        return {
+            "acertos": self.acertos,
+            "falhas": self.falhas,
+            "taxa_acerto": self.taxa_acerto,
+            "expulsoes": self.expulsoes,
+            "estados_em_cache": len(self.cache),
+            "quedas_para_afn": self.quedas_para_afn,
+            "usando_afn": self.usando_afn,
+            "simbolos_afn": self.simbolos_afn,
+        }
+
+    def proximo(self, estados, simbolo):
+        chave = (estados, simbolo)
+        destino = self.cache.get(chave)
+        if destino is not None:
+            self.cache.move_to_end(chave)
+            self.acertos += 1
+            return destino
+        self.falhas += 1
+        destino = frozenset(self.automato.proximo_estado(estados, simbolo))
+        self.cache[chave] = destino
+        if len(self.cache) > self.capacidade:
+            # Remove a transição usada há mais tempo
+            self.cache.popitem(last=False)
+            self.expulsoes += 1
+        return destino
+
+    def aceita(self, cadeia):
+        if self.usando_afn:
+            return self.aceita_afn(self.inicial, cadeia, 0)
+        estados = self.inicial
+        for i, simbolo in enumerate(cadeia):
+            estados = self.proximo(estados, simbolo)
+            if not estados:
+                return False
+            self.consultas_janela += 1
+            if self.consultas_janela == self.janela:
+                acertos = self.acertos - self.acertos_antes_janela
+                self.consultas_janela = 0
+                self.acertos_antes_janela = self.acertos
+                # Cache cheio e errando demais: o AFD não cabe, segue no AFN
+                if len(self.cache) >= self.capacidade and acertos / self.janela < self.taxa_minima:
+                    self.usando_afn = True
+                    self.quedas_para_afn += 1
+                    self.simbolos_ate_reavaliar = self.reavaliar
+                    return self.aceita_afn(estados, cadeia, i + 1)
+        return bool(estados & self.automato.estados_finais)
+
+    def aceita_afn(self, estados, cadeia, inicio):
+        # Continua a simulação no AFN a partir de `estados`, lendo cadeia[inicio:]
+        if self.afn is None:
+            self.afn = AFNBits(self.automato)
+        self.simbolos_afn += len(cadeia) - inicio
+        self.simbolos_ate_reavaliar -= len(cadeia) - inicio
+        if self.simbolos_ate_reavaliar <= 0:
+            # As próximas cadeias voltam a usar o cache, com uma janela nova
+            self.usando_afn = False
+            self.consultas_janela = 0
+            self.acertos_antes_janela = self.acertos
+        afn = self.afn
+        mascara = afn.mascara(estados)
+        for indice in range(inicio, len(cadeia)):
+            mascara = afn.passo(mascara, cadeia[indice])
+            if not mascara:
+                return False
+        return bool(mascara & afn.finais)
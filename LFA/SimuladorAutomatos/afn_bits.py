@@ -0,0 +1,69 @@
+# Simulação de AFN com conjuntos de estados codificados em bits.
+# Os estados são numerados de 0 a n-1 e o conjunto de estados ativos é um
+# inteiro com o bit i ligado se o estado i está ativo. Um passo é o OU das
+# máscaras de sucessores dos estados ativos (uma máscara por estado e
+# símbolo), percorrendo só os bits ligados, sem criar conjuntos a cada símbolo.
+from automato import EPSILON
+
+
+class AFNBits:
+    def __init__(self, automato):
+        self.nomes = sorted(set(automato.estados) | ({automato.estado_atual} if automato.estado_atual is not None else set()))
+        self.indices = {nome: i for i, nome in enumerate(self.nomes)}
+        n = len(self.nomes)
+        self.tem_epsilon = automato.tem_epsilon
+        # Fecho-ε de cada estado como máscara
+        self.fecho = [self.mascara(automato.fecho_epsilon({nome})) for nome in self.nomes]
+        # Sucessores de cada estado por símbolo, já com o fecho aplicado:
+        # k·n máscaras no total
+        self.sucessores = {}
+        for origem, simbolo, destino in automato.arestas():
+            if simbolo == EPSILON:
+                continue
+            mascaras = self.sucessores.setdefault(simbolo, [0] * n)
+            mascaras[self.indices[origem]] |= self.fechar(1 << self.indices[destino])
+        self.inicial = self.fechar(1 << self.indices[automato.estado_atual]) if automato.estado_atual is not None else 0
+        self.finais = self.mascara(automato.estados_finais)
+
+    def mascara(self, estados):
+        mascara = 0
+        for estado in estados:
+            if estado in self.indices:
+                mascara |= 1 << self.indices[estado]
+        return mascara
+
+    def estados(self, mascara):
+        # Nomes dos estados ativos em uma máscara
+        return {nome for i, nome in enumerate(self.nomes) if mascara >> i & 1}
+
+    def fechar(self, mascara):
+        # Sem transições vazias o fecho de cada estado é ele mesmo
+        if not self.tem_epsilon:
+            return mascara
+        # Percorre só os bits ligados, do mais baixo para o mais alto
+        resultado = 0
+        while mascara:
+            bit = mascara & -mascara
+            resultado |= self.fecho[bit.bit_length() - 1]
+            mascara ^= bit
+        return resultado
+
+    def passo(self, mascara, simbolo):
+        mascaras = self.sucessores.get(simbolo)
+        if mascaras is None:
+            return 0
+        # Como em fechar: só os bits ligados
+        proxima = 0
+        while mascara:
+            bit = mascara & -mascara
+            proxima |= mascaras[bit.bit_length() - 1]
+            mascara ^= bit
+        return proxima
+
+    def aceita(self, cadeia):
+        mascara = self.inicial
+        for simbolo in cadeia:
+            mascara = self.passo(mascara, simbolo)
+            if not mascara:
+                return False
+        return bool(mascara & self.finais)
@@ -0,0 +1,202 @@
+# Analisador léxico: percorre um arquivo (ou qualquer sequência de blocos de
+# texto) com um AFD compilado e gera registros (inicio, fim, tipo) com a
+# regra do maior casamento: o token é o prefixo aceito mais longo a partir
+# do início e, em caso de empate, vence o tipo de maior prioridade. Só é
+# guardado o texto desde o início do token atual, então a memória não
+# depende do tamanho do arquivo.
+import argparse
+import sys
+from array import array
+
+from afd import compilar
+from automato import EPSILON, Automato
+from binario import abrir_simulador
+from expressao_regular import compilar_regex
+
+# Tamanho padrão do bloco de leitura (1 Mi caracteres)
+TAMANHO_BLOCO = 1 << 20
+INICIAL = "*"
+
+
+def unir_regras(regras):
+    # Junta várias regras (tipo, Automato ou expressão regular) num único AFN:
+    # um estado inicial novo com transições ε para o inicial de cada regra.
+    # Retorna o AFN e os rótulos (estado final, tipo), na ordem de prioridade
+    uniao = Automato()
+    uniao.estados.add(INICIAL)
+    uniao.definir_estado_inicial(INICIAL)
+    rotulos = []
+    for i, (tipo, regra) in enumerate(regras):
+        automato = compilar_regex(regra) if isinstance(regra, str) else regra
+        nome = lambda estado: f"{i}.{estado}"
+        uniao.estados.update(nome(estado) for estado in automato.estados)
+        for origem, simbolo, destino in automato.arestas():
+            uniao.adicionar_transicao(nome(origem), simbolo, nome(destino))
+        if automato.estado_atual is not None:
+            uniao.adicionar_transicao(INICIAL, EPSILON, nome(automato.estado_atual))
+        rotulos.extend((nome(estado), tipo) for estado in sorted(automato.estados_finais))
+    uniao.definir_estados_finais(estado for estado, _ in rotulos)
+    return uniao, rotulos
+
+
+class Analisador:
+    def __init__(self, automato, rotulos=None):
+        # `rotulos`: lista (estado final, tipo) em ordem de prioridade; sem
+        # rótulos, todo estado final tem o tipo None
+        if rotulos is None:
+            rotulos = [(estado, None) for estado in sorted(automato.estados_finais)]
+        self.tipos = list(dict.fromkeys(tipo for _, tipo in rotulos))
+        prioridade = {}
+        for estado, tipo in rotulos:
+            prioridade.setdefault(estado, self.tipos.index(tipo))
+        self.afd = compilar(automato)
+        # Para cada estado do AFD, o índice do tipo de maior prioridade entre
+        # os seus estados finais, ou -1 se não aceita
+        self.rotulos = array('i', (min((prioridade[e] for e in conjunto if e in prioridade), default=-1)
+                                   for conjunto in self.afd.conjuntos))
+        # Estados mortos: nenhum estado que aceita é alcançável a partir deles,
+        # então o token atual não pode mais crescer (busca reversa no AFD)
+        n = self.afd.quantidade_estados
+        k = self.afd.k
+        anteriores = [[] for _ in range(n)]
+        for origem in range(n):
+            for coluna in range(k):
+                anteriores[self.afd.tabela[origem * k + coluna]].append(origem)
+        vivos = [estado for estado in range(n) if self.rotulos[estado] >= 0]
+        self.mortos = bytearray([1]) * n
+        for estado in vivos:
+            self.mortos[estado] = 0
+        while vivos:
+            for origem in anteriores[vivos.pop()]:
+                if self.mortos[origem]:
+                    self.mortos[origem] = 0
+                    vivos.append(origem)
+
+    @classmethod
+    def de_regras(cls, regras):
+        return cls(*unir_regras(regras))
+
+    def analisar(self, blocos, erros=False):
+        # Gera (inicio, fim, tipo) com posições em caracteres desde o início do
+        # texto. Caracteres que não começam nenhum token são pulados, ou
+        # reportados com tipo None se erros=True
+        tabela = self.afd.tabela
+        simbolos = self.afd.simbolos
+        k = self.afd.k
+        inicial = self.afd.inicial
+        rotulos = self.rotulos
+        mortos = self.mortos
+        tipos = self.tipos
+        blocos = iter(blocos)
+        texto = ""
+        base = 0      # Posição de texto[0] no arquivo
+        inicio = 0    # Início do token atual em `texto`
+        i = 0         # Próximo caractere a ler
+        fim = 0       # Fim do maior prefixo aceito até agora (fim == inicio: nenhum)
+        tipo = -1
+        estado = inicial
+        acabou = False
+        while True:
+            if i < len(texto):
+                coluna = simbolos.get(texto[i])
+                if coluna is not None:
+                    estado = tabela[estado * k + coluna]
+                    if not mortos[estado]:
+                        i += 1
+                        if rotulos[estado] >= 0:
+                            fim = i
+                            tipo = rotulos[estado]
+                        continue
+            elif not acabou:
+                bloco = next(blocos, None)
+                if bloco is None:
+                    acabou = True
+                else:
+                    # Descarta o texto antes do token atual
+                    texto = texto[inicio:] + bloco
+                    base += inicio
+                    i -= inicio
+                    fim -= inicio
+                    inicio = 0
+                continue
+            elif inicio == len(texto):
+                return
+            # O token não pode crescer (símbolo inválido, estado morto ou fim
+            # do texto): emite o maior prefixo aceito e recomeça logo depois dele
+            if fim > inicio:
+                yield (base + inicio, base + fim, tipos[tipo])
+                inicio = fim
+            else:
+                if erros:
+                    yield (base + inicio, base + inicio + 1, None)
+                inicio += 1
+            i = fim = inicio
+            estado = inicial
+
+    def analisar_texto(self, texto, erros=False):
+        return self.analisar([texto], erros)
+
+    def analisar_arquivo(self, caminho, tamanho_bloco=TAMANHO_BLOCO, erros=False):
+        return self.analisar(ler_blocos(caminho, tamanho_bloco), erros)
+
+
+def ler_blocos(caminho, tamanho_bloco=TAMANHO_BLOCO):
+    # Gera o texto do arquivo em blocos de tamanho fixo
+    with open(caminho, 'r', encoding='utf-8', newline='') as arquivo:
+        while True:
+            bloco = arquivo.read(tamanho_bloco)
+            if not bloco:
+                break
+            yield bloco
+
+
+def _par(texto):
+    # "TIPO=valor" -> ("TIPO", "valor")
+    tipo, separador, valor = texto.partition("=")
+    if not separador:
+        raise argparse.ArgumentTypeError(f"Esperado TIPO=valor: {texto!r}")
+    return tipo, valor
+
+
+def _regra(texto):
+    # --regra e --automato vão para a mesma lista, marcados com o tipo de
+    # opção, para que a prioridade siga a ordem da linha de comando
+    return ("regra",) + _par(texto)
+
+
+def _automato(texto):
+    return ("automato",) + _par(texto)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Analisador léxico com AFD e maior casamento.")
+    parser.add_argument("arquivo", help="Arquivo de texto a analisar")
+    parser.add_argument("--regra", dest="regras", type=_regra, action="append", default=[], metavar="TIPO=EXPRESSAO",
+                        help="TIPO=expressão regular (a ordem de --regra e --automato dá a prioridade)")
+    parser.add_argument("--automato", dest="regras", type=_automato, action="append", default=[], metavar="TIPO=ARQUIVO",
+                        help="TIPO=arquivo de autômato (texto ou .aut); todos os estados finais têm esse tipo")
+    parser.add_argument("--rotulo", type=_par, action="append", default=[],
+                        help="ESTADO=TIPO para um único --automato sem regras: dá tipos diferentes a cada estado final")
+    parser.add_argument("--erros", action="store_true", help="Reporta os caracteres que não começam nenhum token")
+    parser.add_argument("--bloco", type=int, default=TAMANHO_BLOCO, help="Tamanho do bloco de leitura em caracteres")
+    args = parser.parse_args()
+
+    regras = [(tipo, abrir_simulador(valor) if opcao == "automato" else valor)
+              for opcao, tipo, valor in args.regras]
+    if args.rotulo:
+        if [opcao for opcao, _, _ in args.regras] != ["automato"]:
+            parser.error("--rotulo só vale com um único --automato e sem --regra")
+        automato = regras[0][1]
+        rotulos = args.rotulo
+        if hasattr(automato, "nomes"):
+            # Arquivo .aut: os estados são numerados, os nomes ficam na tabela
+            indices = {nome: i for i, nome in enumerate(automato.nomes)}
+            rotulos = [(indices.get(estado, estado), tipo) for estado, tipo in rotulos]
+        analisador = Analisador(automato, rotulos)
+    elif regras:
+        analisador = Analisador.de_regras(regras)
+    else:
+        parser.error("Informe ao menos uma --regra ou --automato")
+    saida = sys.stdout
+    for inicio, fim, tipo in analisador.analisar_arquivo(args.arquivo, args.bloco, args.erros):
+        saida.write(f"{inicio}\t{fim}\t{tipo}\n")
@@ -0,0 +1,144 @@
+# Modelo do autômato, sem dependência de interface gráfica.
+# A interface (main.py) e os modos de linha de comando importam daqui.
+
+# Símbolo das transições vazias (ε); no arquivo também vale o símbolo vazio ("s0:>s1")
+EPSILON = "ε"
+
+
+class Automato:
+    def __init__(self):
+        self.estados = set()
+        self.transicoes = {}
+        self.estados_atuais = set()
+        self.estados_finais = set()
+        self.estado_atual = None
+        # Fechos-ε já calculados: conjunto de estados -> fecho
+        self.fechos = {}
+        self.tem_epsilon = False
+        # Coletor opcional de métricas da simulação (metricas.Metricas)
+        self.metricas = None
+
+    def adicionar_transicao(self, origem, simbolo, destino):
+        self.estados.add(origem)
+        self.estados.add(destino)
+        if simbolo in ("", EPSILON):
+            simbolo = EPSILON
+            self.tem_epsilon = True
+            # Uma transição vazia nova invalida os fechos já calculados
+            self.fechos.clear()
+        # Adicionar a transição ao dicionário
+        if (origem, simbolo) not in self.transicoes:
+            self.transicoes[(origem, simbolo)] = set()
+        self.transicoes[(origem, simbolo)].add(destino)
+
+    def fecho_epsilon(self, estados):
+        # Estados alcançáveis só por transições vazias, calculado uma vez por conjunto
+        if not self.tem_epsilon:
+            return frozenset(estados)
+        chave = frozenset(estados)
+        fecho = self.fechos.get(chave)
+        if fecho is None:
+            visitados = set(chave)
+            pilha = list(chave)
+            while pilha:
+                estado = pilha.pop()
+                for destino in self.transicoes.get((estado, EPSILON), ()):
+                    if destino not in visitados:
+                        visitados.add(destino)
+                        pilha.append(destino)
+            fecho = frozenset(visitados)
+            self.fechos[chave] = fecho
+        return fecho
+
+    def estados_iniciais(self):
+        # Estado inicial mais o seu fecho-ε
+        if self.estado_atual is None:
+            return set()
+        return set(self.fecho_epsilon({self.estado_atual}))
+
+    def definir_estado_inicial(self, estado):
+        # Garantir que o estado inicial é um estado válido
+        self.estado_atual = estado
+
+    def definir_estados_finais(self, finais):
+        # Garantir que os estados finais são um conjunto
+        self.estados_finais = set(finais)
+
+    def proximo_estado(self, estados_atuais, simbolo):
+        # Calcular os próximos estados a partir dos estados atuais e do símbolo
+        if simbolo == EPSILON:
+            # ε não é um símbolo da entrada: nenhuma transição o consome
+            return set()
+        proximos_estados = set()
+        for estado in estados_atuais:
+            if (estado, simbolo) in self.transicoes:
+                proximos_estados.update(self.transicoes[(estado, simbolo)])
+        if self.tem_epsilon:
+            proximos_estados = set(self.fecho_epsilon(proximos_estados))
+        return proximos_estados
+
+    def passo(self, estados_atuais, simbolo):
+        # Um símbolo lido na simulação (aceita e a interface): como
+        # proximo_estado, mas registra as métricas. Compilação e produto usam
+        # proximo_estado direto e não entram nas métricas
+        proximos_estados = self.proximo_estado(estados_atuais, simbolo)
+        if self.metricas is not None:
+            self.metricas.registrar(estados_atuais, simbolo, self.transicoes, proximos_estados)
+        return proximos_estados
+
+    def arestas(self):
+        # Todas as transições como (origem, símbolo, destino)
+        for (origem, simbolo), destinos in self.transicoes.items():
+            for destino in destinos:
+                yield origem, simbolo, destino
+
+    def alfabeto(self):
+        # Símbolos usados nas transições (sem o ε)
+        return {simbolo for (_, simbolo) in self.transicoes if simbolo != EPSILON}
+
+    def aceita(self, cadeia):
+        # Simula a cadeia inteira a partir do estado inicial
+        if self.metricas is not None:
+            self.metricas.nova_cadeia()
+        estados = self.estados_iniciais()
+        for simbolo in cadeia:
+            estados = self.passo(estados, simbolo)
+            if not estados:
+                return False
+        return bool(estados & self.estados_finais)
+
+
+def carregar_automato(caminho):
+    # Lê o formato de texto do projeto (#states, #initial, #accepting,
+    # #alphabet, #transitions). Todas as transições de um mesmo
+    # (origem, símbolo) são mantidas, então AFNs são carregados sem perdas.
+    # Transições vazias usam o símbolo ε ou nenhum símbolo ("s0:>s1").
+    automato = Automato()
+    estado_inicial = None
+    estados_finais = set()
+    section = None
+    with open(caminho, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            if line.startswith("#"):
+                section = line[1:].strip()  # Pega a seção após o #
+            elif section == "states":
+                automato.estados.add(line)
+            elif section == "initial":
+                estado_inicial = line
+            elif section == "accepting":
+                estados_finais.add(line)
+            elif section == "transitions":
+                # Tratar a linha de transição (origem:símbolo>destino)
+                origem, resto = line.split(":", 1)
+                simbolo, destino = resto.rsplit(">", 1)
+                automato.adicionar_transicao(origem, simbolo, destino)
+    # Verificar se o estado inicial foi informado
+    if estado_inicial is None:
+        raise ValueError("Faltam seções ou dados no arquivo.")
+    automato.estados.add(estado_inicial)
+    automato.definir_estado_inicial(estado_inicial)
+    automato.definir_estados_finais(estados_finais)
+    return automato
@@ -0,0 +1,288 @@
+# Formato binário versionado para autômatos grandes.
+# Estados e símbolos viram inteiros (tabelas de nomes no fim do arquivo) e
+# as transições ficam em formato CSR, ordenadas por (origem, símbolo):
+#   inicio[n + 1]  (int64): transições do estado e estão em [inicio[e], inicio[e + 1])
+#   simbolos[t]    (int32): símbolo de cada transição
+#   destinos[t]    (int32): destino de cada transição
+# Vários destinos para o mesmo (origem, símbolo) são transições separadas,
+# então AFNs (inclusive com ε) são guardados sem perdas. Os arrays começam
+# alinhados em 8 bytes e podem ser mapeados direto da memória com NumPy; sem
+# NumPy são lidos com array.
+import argparse
+import json
+import struct
+import sys
+from array import array
+from bisect import bisect_left, bisect_right
+from time import perf_counter
+
+from automato import EPSILON, Automato, carregar_automato
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+MAGICO = b"AUTB"
+VERSAO = 1
+EXTENSAO = ".aut"
+
+
+def _alinhar(posicao):
+    return (posicao + 7) & ~7
+
+
+def salvar_binario(automato, caminho):
+    nomes = sorted(automato.estados | ({automato.estado_atual} if automato.estado_atual is not None else set()))
+    estados = {nome: i for i, nome in enumerate(nomes)}
+    simbolos_nomes = sorted({simbolo for (_, simbolo) in automato.transicoes})
+    simbolos = {simbolo: i for i, simbolo in enumerate(simbolos_nomes)}
+    trios = sorted((estados[origem], simbolos[simbolo], estados[destino])
+                   for (origem, simbolo), destinos in automato.transicoes.items()
+                   for destino in destinos)
+    # Ponteiros de início de cada linha (estado) da CSR
+    inicio = array('q', [0] * (len(nomes) + 1))
+    for origem, _, _ in trios:
+        inicio[origem + 1] += 1
+    for e in range(len(nomes)):
+        inicio[e + 1] += inicio[e]
+    coluna = array('i', (s for _, s, _ in trios))
+    destino = array('i', (d for _, _, d in trios))
+    # Estados finais que não aparecem no autômato nunca são alcançados: ficam de fora
+    finais = array('i', sorted(estados[e] for e in automato.estados_finais if e in estados))
+    texto_estados = "\n".join(nomes).encode("utf-8")
+    texto_simbolos = "\n".join(simbolos_nomes).encode("utf-8")
+    cabecalho = {
+        "versao": VERSAO,
+        "estados": len(nomes),
+        "simbolos": len(simbolos_nomes),
+        "transicoes": len(trios),
+        "finais": len(finais),
+        "inicial": estados[automato.estado_atual] if automato.estado_atual is not None else -1,
+        "epsilon": simbolos.get(EPSILON, -1),
+        "bytes_estados": len(texto_estados),
+        "bytes_simbolos": len(texto_simbolos),
+    }
+    dados = json.dumps(cabecalho).encode("utf-8")
+    blocos = [inicio, coluna, destino, finais]
+    if sys.byteorder != "little":
+        for bloco in blocos:
+            bloco.byteswap()
+    with open(caminho, 'wb') as arquivo:
+        arquivo.write(MAGICO)
+        arquivo.write(struct.pack("<I", len(dados)))
+        arquivo.write(dados)
+        arquivo.write(b"\0" * (_alinhar(arquivo.tell()) - arquivo.tell()))
+        for bloco in blocos:
+            arquivo.write(bloco.tobytes())
+        arquivo.write(texto_estados)
+        arquivo.write(texto_simbolos)
+
+
+def _ler_array(arquivo, caminho, posicao, codigo, quantidade, usar_mmap):
+    # Com NumPy o array é mapeado da memória (só as páginas usadas são lidas);
+    # sem NumPy, é lido de uma vez com array
+    if np is not None:
+        tipo = np.dtype("<i8" if codigo == 'q' else "<i4")
+        if usar_mmap and quantidade:
+            return np.memmap(caminho, dtype=tipo, mode='r', offset=posicao, shape=(quantidade,))
+        arquivo.seek(posicao)
+        return np.fromfile(arquivo, dtype=tipo, count=quantidade)
+    arquivo.seek(posicao)
+    valores = array(codigo)
+    valores.fromfile(arquivo, quantidade)
+    if sys.byteorder != "little":
+        valores.byteswap()
+    return valores
+
+
+def carregar_binario(caminho, usar_mmap=True):
+    with open(caminho, 'rb') as arquivo:
+        if arquivo.read(4) != MAGICO:
+            raise ValueError("Arquivo de autômato binário inválido.")
+        (tamanho,) = struct.unpack("<I", arquivo.read(4))
+        cabecalho = json.loads(arquivo.read(tamanho).decode("utf-8"))
+        if cabecalho.get("versao") != VERSAO:
+            raise ValueError(f"Versão de autômato não suportada: {cabecalho.get('versao')}")
+        n = cabecalho["estados"]
+        t = cabecalho["transicoes"]
+        posicao = _alinhar(8 + tamanho)
+        inicio = _ler_array(arquivo, caminho, posicao, 'q', n + 1, usar_mmap)
+        posicao += 8 * (n + 1)
+        simbolos = _ler_array(arquivo, caminho, posicao, 'i', t, usar_mmap)
+        posicao += 4 * t
+        destinos = _ler_array(arquivo, caminho, posicao, 'i', t, usar_mmap)
+        posicao += 4 * t
+        finais = _ler_array(arquivo, caminho, posicao, 'i', cabecalho["finais"], False)
+        posicao += 4 * cabecalho["finais"]
+        arquivo.seek(posicao)
+        nomes = arquivo.read(cabecalho["bytes_estados"]).decode("utf-8").split("\n") if n else []
+        nomes_simbolos = arquivo.read(cabecalho["bytes_simbolos"]).decode("utf-8").split("\n") if cabecalho["simbolos"] else []
+    return AutomatoCSR(nomes, nomes_simbolos, inicio, simbolos, destinos,
+                       cabecalho["inicial"], finais, cabecalho["epsilon"])
+
+
+class AutomatoCSR:
+    # Autômato lido do formato binário, simulado direto sobre os arrays:
+    # estados são inteiros e as transições de (estado, símbolo) são achadas
+    # por busca binária dentro da linha do estado. Tem a mesma interface de
+    # simulação do Automato (alfabeto, estados_iniciais, proximo_estado,
+    # estados_finais...), então pode ser passado direto para compilar,
+    # AFNBits, AFDPreguicoso e produto sem reconstruir os dicionários.
+    def __init__(self, nomes, nomes_simbolos, inicio, simbolos, destinos, inicial, finais, epsilon=-1):
+        self.nomes = nomes
+        self.nomes_simbolos = nomes_simbolos
+        self.indices_simbolos = {simbolo: i for i, simbolo in enumerate(nomes_simbolos)}
+        self.inicio = inicio
+        self.simbolos = simbolos
+        self.destinos = destinos
+        self.inicial = inicial
+        self.epsilon = epsilon
+        self.fechos = {}
+        # Interface do Automato, com os estados numerados
+        self.estados = range(len(nomes))
+        self.estado_atual = inicial if inicial >= 0 else None
+        self.estados_finais = set(finais.tolist())
+        self.tem_epsilon = epsilon >= 0
+        # Com NumPy a busca na linha é feita por searchsorted (em C); indexar
+        # um memmap elemento por elemento com bisect passaria pelo Python
+        self.vetorizado = np is not None and not isinstance(simbolos, array)
+
+    @property
+    def quantidade_estados(self):
+        return len(self.nomes)
+
+    @property
+    def quantidade_transicoes(self):
+        return len(self.destinos)
+
+    def alfabeto(self):
+        return {simbolo for i, simbolo in enumerate(self.nomes_simbolos) if i != self.epsilon}
+
+    def sucessores(self, estado, simbolo):
+        # Destinos de (estado, símbolo): um trecho contíguo da linha do estado
+        inicio = int(self.inicio[estado])
+        fim = int(self.inicio[estado + 1])
+        if self.vetorizado:
+            linha = self.simbolos[inicio:fim]
+            a = inicio + int(linha.searchsorted(simbolo, "left"))
+            b = inicio + int(linha.searchsorted(simbolo, "right"))
+        else:
+            a = bisect_left(self.simbolos, simbolo, inicio, fim)
+            b = bisect_right(self.simbolos, simbolo, a, fim)
+        return self.destinos[a:b].tolist()
+
+    def arestas(self):
+        # Todas as transições como (origem, símbolo, destino)
+        inicio = self.inicio.tolist()
+        simbolos = self.nomes_simbolos
+        destinos = self.destinos.tolist()
+        colunas = self.simbolos.tolist()
+        for origem in range(len(self.nomes)):
+            for i in range(inicio[origem], inicio[origem + 1]):
+                yield origem, simbolos[colunas[i]], destinos[i]
+
+    def fecho_epsilon(self, estados):
+        if self.epsilon < 0:
+            return frozenset(estados)
+        chave = frozenset(estados)
+        fecho = self.fechos.get(chave)
+        if fecho is None:
+            visitados = set(chave)
+            pilha = list(chave)
+            while pilha:
+                for destino in self.sucessores(pilha.pop(), self.epsilon):
+                    if destino not in visitados:
+                        visitados.add(destino)
+                        pilha.append(destino)
+            fecho = frozenset(visitados)
+            self.fechos[chave] = fecho
+        return fecho
+
+    def estados_iniciais(self):
+        if self.inicial < 0:
+            return set()
+        return set(self.fecho_epsilon({self.inicial}))
+
+    def proximo_estado(self, estados, simbolo):
+        # Mesmo contrato de Automato.proximo_estado, com estados numerados
+        coluna = self.indices_simbolos.get(simbolo)
+        if coluna is None or coluna == self.epsilon:
+            return set()
+        proximos = set()
+        for estado in estados:
+            proximos.update(self.sucessores(estado, coluna))
+        return set(self.fecho_epsilon(proximos))
+
+    def aceita(self, cadeia):
+        estados = self.estados_iniciais()
+        for simbolo in cadeia:
+            estados = self.proximo_estado(estados, simbolo)
+            if not estados:
+                return False
+        return bool(estados & self.estados_finais)
+
+    def para_automato(self):
+        # Converte para Automato (com nomes), para a interface e para editar.
+        # O dicionário de transições é montado de uma vez, sem passar por
+        # adicionar_transicao a cada transição
+        automato = Automato()
+        nomes = self.nomes
+        simbolos = self.nomes_simbolos
+        inicio = self.inicio.tolist()
+        colunas = self.simbolos.tolist()
+        destinos = self.destinos.tolist()
+        transicoes = automato.transicoes
+        for origem in range(len(nomes)):
+            nome = nomes[origem]
+            a = inicio[origem]
+            fim = inicio[origem + 1]
+            # As transições da linha estão ordenadas por símbolo: cada trecho
+            # com o mesmo símbolo vira um conjunto de destinos
+            while a < fim:
+                coluna = colunas[a]
+                b = a + 1
+                while b < fim and colunas[b] == coluna:
+                    b += 1
+                transicoes[(nome, simbolos[coluna])] = {nomes[d] for d in destinos[a:b]}
+                a = b
+        automato.estados.update(nomes)
+        automato.tem_epsilon = self.tem_epsilon
+        if self.inicial >= 0:
+            automato.definir_estado_inicial(nomes[self.inicial])
+        automato.definir_estados_finais(nomes[e] for e in self.estados_finais)
+        return automato
+
+
+def abrir_automato(caminho):
+    # Escolhe o formato pela extensão: .aut é binário, o resto é o formato de texto.
+    # Sempre retorna um Automato (com nomes), que pode ser editado
+    if caminho.endswith(EXTENSAO):
+        return carregar_binario(caminho).para_automato()
+    return carregar_automato(caminho)
+
+
+def abrir_simulador(caminho):
+    # Como abrir_automato, mas arquivos .aut ficam no AutomatoCSR, sem
+    # reconstruir os dicionários: para simular, compilar e comparar
+    if caminho.endswith(EXTENSAO):
+        return carregar_binario(caminho)
+    return carregar_automato(caminho)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Converte um autômato do formato de texto para o binário (.aut).")
+    parser.add_argument("entrada", help="Autômato no formato de texto (#states/#transitions)")
+    parser.add_argument("saida", help="Arquivo binário de saída")
+    args = parser.parse_args()
+
+    t0 = perf_counter()
+    automato = carregar_automato(args.entrada)
+    t1 = perf_counter()
+    salvar_binario(automato, args.saida)
+    t2 = perf_counter()
+    binario = carregar_binario(args.saida)
+    t3 = perf_counter()
+    print(f"{binario.quantidade_estados} estados, {binario.quantidade_transicoes} transições", file=sys.stderr)
+    print(f"Texto lido em {(t1 - t0) * 1000:.3f} ms, binário salvo em {(t2 - t1) * 1000:.3f} ms "
+          f"e carregado em {(t3 - t2) * 1000:.3f} ms", file=sys.stderr)
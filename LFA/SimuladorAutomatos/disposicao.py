@@ -0,0 +1,165 @@
+# Posicionamento dos estados para o desenho, por forças (Fruchterman-Reingold):
+# transições puxam os estados ligados e todos os estados se repelem. A
+# repulsão entre todos os pares custaria O(n²) por iteração; com a
+# aproximação de Barnes-Hut, uma quadtree agrupa estados distantes num único
+# centro de massa e cada iteração custa O(n log n).
+import math
+import random
+
+# Abaixo desta razão (tamanho do quadrante / distância) o quadrante inteiro
+# age como um único corpo
+THETA = 0.8
+# Profundidade máxima da quadtree, para estados quase sobrepostos
+PROFUNDIDADE_MAXIMA = 24
+
+
+class Quadtree:
+    # Nós guardados em listas paralelas; o nó 0 é a raiz. Cada nó tem o centro
+    # de massa dos estados dentro dele, a quantidade de estados e os 4 filhos
+    def __init__(self, xs, ys):
+        self.xs = xs
+        self.ys = ys
+        x0, x1 = min(xs), max(xs)
+        y0, y1 = min(ys), max(ys)
+        self.x0 = [x0]
+        self.y0 = [y0]
+        self.lado = [max(x1 - x0, y1 - y0, 1e-9)]
+        self.massa = [0]
+        self.cx = [0.0]
+        self.cy = [0.0]
+        self.corpo = [-1]  # Índice do estado, se o nó for uma folha com um só estado
+        self.filhos = [None]
+        for i in range(len(xs)):
+            self.inserir(i, xs[i], ys[i])
+
+    def novo_no(self, x0, y0, lado):
+        self.x0.append(x0)
+        self.y0.append(y0)
+        self.lado.append(lado)
+        self.massa.append(0)
+        self.cx.append(0.0)
+        self.cy.append(0.0)
+        self.corpo.append(-1)
+        self.filhos.append(None)
+        return len(self.massa) - 1
+
+    def quadrante(self, no, x, y):
+        # Filho de `no` que contém o ponto (criado se ainda não existir)
+        metade = self.lado[no] / 2
+        direita = x >= self.x0[no] + metade
+        baixo = y >= self.y0[no] + metade
+        q = direita + 2 * baixo
+        if self.filhos[no] is None:
+            self.filhos[no] = [-1, -1, -1, -1]
+        filho = self.filhos[no][q]
+        if filho == -1:
+            filho = self.novo_no(self.x0[no] + metade * direita, self.y0[no] + metade * baixo, metade)
+            self.filhos[no][q] = filho
+        return filho
+
+    def inserir(self, i, x, y):
+        no = 0
+        profundidade = 0
+        while True:
+            # Atualiza o centro de massa de cada nó no caminho
+            m = self.massa[no]
+            self.cx[no] = (self.cx[no] * m + x) / (m + 1)
+            self.cy[no] = (self.cy[no] * m + y) / (m + 1)
+            self.massa[no] = m + 1
+            if m == 0:
+                self.corpo[no] = i
+                return
+            if profundidade >= PROFUNDIDADE_MAXIMA:
+                # Pontos praticamente iguais: ficam somados neste nó
+                return
+            # Se era uma folha com um estado, empurra esse estado para um filho
+            anterior = self.corpo[no]
+            if anterior != -1:
+                self.corpo[no] = -1
+                px, py = self.xs[anterior], self.ys[anterior]
+                filho = self.quadrante(no, px, py)
+                self.massa[filho] = 1
+                self.cx[filho] = px
+                self.cy[filho] = py
+                self.corpo[filho] = anterior
+            no = self.quadrante(no, x, y)
+            profundidade += 1
+
+    def repulsao(self, i, x, y, k2):
+        # Força de repulsão k²/d sobre o estado i, somada sobre a árvore
+        fx = fy = 0.0
+        pilha = [0]
+        while pilha:
+            no = pilha.pop()
+            if self.corpo[no] == i and self.massa[no] == 1:
+                continue
+            dx = x - self.cx[no]
+            dy = y - self.cy[no]
+            d2 = dx * dx + dy * dy
+            filhos = self.filhos[no]
+            if filhos is None or self.lado[no] * self.lado[no] < THETA * THETA * d2:
+                if d2 < 1e-12:
+                    continue
+                forca = self.massa[no] * k2 / d2
+                fx += dx * forca
+                fy += dy * forca
+            else:
+                pilha.extend(f for f in filhos if f != -1)
+        return fx, fy
+
+
+def posicionar(estados, arestas, iteracoes=80, semente=0):
+    # Retorna {estado: (x, y)} com x e y em [0, 1]. `arestas` são pares
+    # (origem, destino); laços e arestas repetidas não mudam o resultado
+    estados = sorted(estados)
+    n = len(estados)
+    if n == 0:
+        return {}
+    if n == 1:
+        return {estados[0]: (0.5, 0.5)}
+    indices = {estado: i for i, estado in enumerate(estados)}
+    pares = {(min(indices[a], indices[b]), max(indices[a], indices[b]))
+             for a, b in arestas if a in indices and b in indices and a != b}
+    # Começa num círculo (como o desenho antigo), com uma pequena perturbação
+    # para quebrar simetrias
+    gerador = random.Random(semente)
+    xs = [0.5 + 0.4 * math.cos(2 * math.pi * i / n) + gerador.uniform(-1e-3, 1e-3) for i in range(n)]
+    ys = [0.5 + 0.4 * math.sin(2 * math.pi * i / n) + gerador.uniform(-1e-3, 1e-3) for i in range(n)]
+    # Distância ideal entre estados numa área unitária
+    k = math.sqrt(1.0 / n)
+    k2 = k * k
+    temperatura = 0.1
+    resfriamento = temperatura / (iteracoes + 1)
+    for _ in range(iteracoes):
+        arvore = Quadtree(xs, ys)
+        dxs = [0.0] * n
+        dys = [0.0] * n
+        for i in range(n):
+            dxs[i], dys[i] = arvore.repulsao(i, xs[i], ys[i], k2)
+        # Atração d²/k ao longo de cada transição
+        for a, b in pares:
+            dx = xs[a] - xs[b]
+            dy = ys[a] - ys[b]
+            d = math.hypot(dx, dy)
+            if d < 1e-9:
+                continue
+            forca = d / k
+            dxs[a] -= dx * forca
+            dys[a] -= dy * forca
+            dxs[b] += dx * forca
+            dys[b] += dy * forca
+        # Cada estado anda na direção da força, limitado pela temperatura
+        for i in range(n):
+            d = math.hypot(dxs[i], dys[i])
+            if d > 1e-12:
+                passo = min(d, temperatura) / d
+                xs[i] += dxs[i] * passo
+                ys[i] += dys[i] * passo
+        temperatura -= resfriamento
+    # Normaliza para o quadrado [0, 1] mantendo a proporção
+    x0, y0 = min(xs), min(ys)
+    escala = max(max(xs) - x0, max(ys) - y0, 1e-9)
+    deslocamento_x = (1 - (max(xs) - x0) / escala) / 2
+    deslocamento_y = (1 - (max(ys) - y0) / escala) / 2
+    return {estado: ((xs[i] - x0) / escala + deslocamento_x, (ys[i] - y0) / escala + deslocamento_y)
+            for estado, i in indices.items()}
@@ -0,0 +1,147 @@
+# Compilador de expressões regulares para Automato pela construção de
+# Thompson. Suporta concatenação, alternativa (|), fecho (*), fecho positivo
+# (+), opcional (?), parênteses, classes de caracteres ([abc], [a-z]) e
+# escape com barra invertida. O AFN gerado usa transições ε e pode seguir
+# para afd.compilar e minimizacao.minimizar.
+from automato import Automato, EPSILON
+
+
+class CompiladorRegex:
+    def __init__(self, padrao):
+        self.padrao = padrao
+        self.posicao = 0
+        self.automato = Automato()
+        self.contador = 0
+
+    def novo_estado(self):
+        estado = f"t{self.contador}"
+        self.contador += 1
+        self.automato.estados.add(estado)
+        return estado
+
+    def erro(self, mensagem):
+        raise ValueError(f"{mensagem} na posição {self.posicao} de '{self.padrao}'")
+
+    def atual(self):
+        return self.padrao[self.posicao] if self.posicao < len(self.padrao) else None
+
+    def compilar(self):
+        inicio, fim = self.alternativa()
+        if self.posicao < len(self.padrao):
+            self.erro(f"Caractere inesperado '{self.atual()}'")
+        self.automato.definir_estado_inicial(inicio)
+        self.automato.definir_estados_finais({fim})
+        return self.automato
+
+    # Cada regra devolve um fragmento (estado inicial, estado final)
+
+    def alternativa(self):
+        inicio, fim = self.concatenacao()
+        if self.atual() != "|":
+            return inicio, fim
+        novo_inicio = self.novo_estado()
+        novo_fim = self.novo_estado()
+        self.ligar(novo_inicio, inicio, fim, novo_fim)
+        while self.atual() == "|":
+            self.posicao += 1
+            inicio, fim = self.concatenacao()
+            self.ligar(novo_inicio, inicio, fim, novo_fim)
+        return novo_inicio, novo_fim
+
+    def ligar(self, novo_inicio, inicio, fim, novo_fim):
+        self.automato.adicionar_transicao(novo_inicio, EPSILON, inicio)
+        self.automato.adicionar_transicao(fim, EPSILON, novo_fim)
+
+    def concatenacao(self):
+        fragmentos = []
+        while self.atual() is not None and self.atual() not in "|)":
+            fragmentos.append(self.repeticao())
+        if not fragmentos:
+            # Expressão vazia: aceita só a cadeia vazia
+            inicio = self.novo_estado()
+            fim = self.novo_estado()
+            self.automato.adicionar_transicao(inicio, EPSILON, fim)
+            return inicio, fim
+        for (_, fim), (inicio, _) in zip(fragmentos, fragmentos[1:]):
+            self.automato.adicionar_transicao(fim, EPSILON, inicio)
+        return fragmentos[0][0], fragmentos[-1][1]
+
+    def repeticao(self):
+        inicio, fim = self.atomo()
+        while self.atual() in ("*", "+", "?"):
+            operador = self.atual()
+            self.posicao += 1
+            novo_inicio = self.novo_estado()
+            novo_fim = self.novo_estado()
+            self.automato.adicionar_transicao(novo_inicio, EPSILON, inicio)
+            self.automato.adicionar_transicao(fim, EPSILON, novo_fim)
+            if operador in ("*", "+"):
+                # Volta do fim para o início para repetir
+                self.automato.adicionar_transicao(fim, EPSILON, inicio)
+            if operador in ("*", "?"):
+                # Pula o fragmento inteiro
+                self.automato.adicionar_transicao(novo_inicio, EPSILON, novo_fim)
+            inicio, fim = novo_inicio, novo_fim
+        return inicio, fim
+
+    def atomo(self):
+        caractere = self.atual()
+        if caractere == "(":
+            self.posicao += 1
+            fragmento = self.alternativa()
+            if self.atual() != ")":
+                self.erro("Falta ')'")
+            self.posicao += 1
+            return fragmento
+        if caractere == "[":
+            return self.simbolos(self.classe())
+        if caractere in ("*", "+", "?", ")", "]"):
+            self.erro(f"Operador '{caractere}' sem operando")
+        return self.simbolos([self.literal()])
+
+    def literal(self):
+        caractere = self.atual()
+        if caractere == "\\":
+            self.posicao += 1
+            caractere = self.atual()
+            if caractere is None:
+                self.erro("Escape sem caractere")
+        if caractere == EPSILON:
+            # Viraria uma transição vazia; a cadeia vazia se escreve "()"
+            self.erro(f"'{EPSILON}' não pode ser usado como símbolo")
+        self.posicao += 1
+        return caractere
+
+    def classe(self):
+        # [abc] ou [a-z0-9]: conjunto de símbolos alternativos
+        self.posicao += 1
+        simbolos = []
+        while self.atual() != "]":
+            if self.atual() is None:
+                self.erro("Falta ']'")
+            primeiro = self.literal()
+            if self.atual() == "-" and self.posicao + 1 < len(self.padrao) and self.padrao[self.posicao + 1] != "]":
+                self.posicao += 1
+                ultimo = self.literal()
+                if ord(ultimo) < ord(primeiro):
+                    self.erro(f"Intervalo inválido '{primeiro}-{ultimo}'")
+                simbolos.extend(chr(c) for c in range(ord(primeiro), ord(ultimo) + 1))
+            else:
+                simbolos.append(primeiro)
+        self.posicao += 1
+        if not simbolos:
+            self.erro("Classe de caracteres vazia")
+        return simbolos
+
+    def simbolos(self, simbolos):
+        # Um único par de estados com uma transição para cada símbolo
+        inicio = self.novo_estado()
+        fim = self.novo_estado()
+        for simbolo in dict.fromkeys(simbolos):
+            self.automato.adicionar_transicao(inicio, simbolo, fim)
+        return inicio, fim
+
+
+def compilar_regex(padrao):
+    # Devolve um Automato (AFN com transições ε) que reconhece a expressão
+    return CompiladorRegex(padrao).compilar()
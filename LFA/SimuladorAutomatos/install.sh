@@ -8,3 +8,4 @@ conda install pyqt=5.15.4 -y
 
 
 
+conda install numpy -y
@@ -0,0 +1,97 @@
+# Teste de aceitação em lote, sem interface gráfica e sem a animação do QTimer.
+# Lê um autômato salvo e uma cadeia por linha (de um arquivo ou da entrada
+# padrão), imprime "aceita" ou "rejeita" para cada uma e, no fim, a vazão
+# em cadeias/s e símbolos/s.
+import argparse
+import sys
+from itertools import islice
+from time import perf_counter
+
+from binario import abrir_simulador
+from afd import compilar
+from minimizacao import minimizar
+from afn_bits import AFNBits
+from afd_preguicoso import AFDPreguicoso
+
+
+def executar(simulador, linhas, saida=None):
+    # Retorna (cadeias, símbolos, aceitas); escreve o resultado de cada cadeia em `saida`
+    aceita = simulador.aceita
+    cadeias = simbolos = aceitas = 0
+    for linha in linhas:
+        cadeia = linha.rstrip("\r\n")
+        resultado = aceita(cadeia)
+        cadeias += 1
+        simbolos += len(cadeia)
+        aceitas += resultado
+        if saida is not None:
+            saida.write("aceita\n" if resultado else "rejeita\n")
+    return cadeias, simbolos, aceitas
+
+
+def executar_vetorizado(afd, linhas, saida=None, tamanho_lote=100000):
+    # Como executar, mas simula `tamanho_lote` cadeias de cada vez com NumPy
+    # NumPy só é importado neste modo
+    from lote_numpy import aceitar_lote, tabela_estendida
+    tabela = tabela_estendida(afd)
+    linhas = iter(linhas)
+    cadeias = simbolos = aceitas = 0
+    while True:
+        lote = [linha.rstrip("\r\n") for linha in islice(linhas, tamanho_lote)]
+        if not lote:
+            break
+        resultados = aceitar_lote(afd, lote, tabela)
+        cadeias += len(lote)
+        simbolos += sum(map(len, lote))
+        aceitas += int(resultados.sum())
+        if saida is not None:
+            saida.write("".join("aceita\n" if r else "rejeita\n" for r in resultados.tolist()))
+    return cadeias, simbolos, aceitas
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Testa muitas cadeias em um autômato salvo.")
+    parser.add_argument("automato", help="Arquivo do autômato (#states/#transitions ou binário .aut)")
+    parser.add_argument("entradas", nargs="?", default="-", help="Arquivo com uma cadeia por linha (padrão: entrada padrão)")
+    parser.add_argument("--resumo", action="store_true", help="Imprime só o resumo, sem o resultado de cada cadeia")
+    parser.add_argument("--modo", choices=["afd", "afn", "preguicoso", "numpy"], default="afd",
+                        help="afd: compila e minimiza o AFD; afn: simula o AFN com máscaras de bits, sem determinizar; "
+                             "preguicoso: cria os estados do AFD sob demanda, com cache limitado; "
+                             "numpy: simula lotes de cadeias no AFD minimizado com NumPy")
+    parser.add_argument("--lote", type=int, default=100000, help="Cadeias por lote no modo numpy")
+    parser.add_argument("--cache", type=int, default=10000, help="Transições guardadas no modo preguicoso")
+    args = parser.parse_args()
+
+    t0 = perf_counter()
+    automato = abrir_simulador(args.automato)
+    if args.modo in ("afd", "numpy"):
+        afd = compilar(automato)
+        simulador = minimizar(afd)
+        descricao = f"AFD: {afd.quantidade_estados} estados, minimizado: {simulador.quantidade_estados}"
+    elif args.modo == "afn":
+        # Útil quando a construção de subconjuntos gera estados demais
+        simulador = AFNBits(automato)
+        descricao = f"AFN em bits: {len(simulador.nomes)} estados"
+    else:
+        simulador = AFDPreguicoso(automato, capacidade=args.cache)
+        descricao = f"AFD preguiçoso: cache de {args.cache} transições"
+    t1 = perf_counter()
+    saida = None if args.resumo else sys.stdout
+    if args.modo == "numpy":
+        rodar = lambda linhas: executar_vetorizado(simulador, linhas, saida, args.lote)
+    else:
+        rodar = lambda linhas: executar(simulador, linhas, saida)
+    if args.entradas == "-":
+        cadeias, simbolos, aceitas = rodar(sys.stdin)
+    else:
+        with open(args.entradas, 'r', encoding='utf-8') as arquivo:
+            cadeias, simbolos, aceitas = rodar(arquivo)
+    t2 = perf_counter()
+
+    tempo = t2 - t1
+    print(f"{descricao} (preparação em {(t1 - t0) * 1000:.3f} ms)", file=sys.stderr)
+    print(f"{cadeias} cadeias ({aceitas} aceitas, {cadeias - aceitas} rejeitadas) em {tempo:.3f} s: "
+          f"{cadeias / tempo if tempo else 0:.0f} cadeias/s, {simbolos / tempo if tempo else 0:.0f} símbolos/s",
+          file=sys.stderr)
+    if args.modo == "preguicoso":
+        print(f"Cache: {simulador.contadores()}", file=sys.stderr)
@@ -0,0 +1,68 @@
+# Simulação vetorizada de muitas cadeias em um AFD compilado, com NumPy.
+# As N cadeias viram uma matriz de inteiros (com preenchimento no fim das
+# mais curtas) e um vetor com os N estados atuais avança uma posição por vez
+# com indexação avançada na tabela de transições.
+import numpy as np
+
+
+def tabela_estendida(afd):
+    # Tabela (n+1) x (k+2): a coluna k é o preenchimento (mantém o estado),
+    # a coluna k+1 é símbolo fora do alfabeto e a linha n é um estado de
+    # rejeição que não sai de si mesmo
+    n = afd.quantidade_estados
+    k = afd.k
+    tabela = np.full((n + 1, k + 2), n, dtype=np.int32)
+    if k:
+        tabela[:n, :k] = np.frombuffer(afd.tabela, dtype=np.int32).reshape(n, k)
+    tabela[:, k] = np.arange(n + 1, dtype=np.int32)
+    finais = np.zeros(n + 1, dtype=bool)
+    finais[:n] = np.frombuffer(afd.finais, dtype=np.int8) == 1
+    return tabela, finais
+
+
+def codificar(afd, cadeias):
+    # Matriz (maior tamanho) x N com a coluna de cada símbolo na tabela. Fica
+    # transposta (uma linha por posição) para que cada passo leia memória contígua
+    k = afd.k
+    # Com até 256 colunas cada símbolo cabe em um byte: 4x menos memória para percorrer
+    tipo = np.uint8 if k + 2 <= 256 else np.int32
+    tamanhos = np.fromiter(map(len, cadeias), dtype=np.int64, count=len(cadeias))
+    largura = int(tamanhos.max()) if len(cadeias) else 0
+    matriz = np.full((largura, len(cadeias)), k, dtype=tipo)
+    if not tamanhos.sum():
+        return matriz
+    # Todas as cadeias juntas como pontos de código (um byte por símbolo se o
+    # texto for latin-1), traduzidos por uma tabela de consulta
+    junto = "".join(cadeias)
+    try:
+        codigos = np.frombuffer(junto.encode("latin-1"), dtype=np.uint8)
+        traducao = np.full(256, k + 1, dtype=tipo)
+    except UnicodeEncodeError:
+        codigos = np.frombuffer(junto.encode("utf-32-le"), dtype=np.uint32)
+        traducao = np.full(int(codigos.max()) + 1, k + 1, dtype=tipo)
+    for simbolo, coluna in afd.simbolos.items():
+        if len(simbolo) == 1 and ord(simbolo) < len(traducao):
+            traducao[ord(simbolo)] = coluna
+    cadeia = np.repeat(np.arange(len(cadeias)), tamanhos)
+    inicios = np.cumsum(tamanhos) - tamanhos
+    posicao = np.arange(len(codigos)) - inicios[cadeia]
+    matriz[posicao, cadeia] = traducao[codigos]
+    return matriz
+
+
+def aceitar_lote(afd, cadeias, tabela=None):
+    # Vetor booleano: aceita[i] indica se cadeias[i] foi aceita
+    if tabela is None:
+        tabela = tabela_estendida(afd)
+    transicoes, finais = tabela
+    # Tabela achatada e pré-multiplicada: cada estado é guardado como
+    # estado * largura, então a transição de (estado, coluna) fica em
+    # planas[estado + coluna] e o passo é uma soma e uma consulta, sem temporários
+    largura = transicoes.shape[1]
+    planas = (transicoes * largura).ravel()
+    matriz = codificar(afd, cadeias)
+    estados = np.full(len(cadeias), afd.inicial * largura, dtype=np.int32)
+    for simbolos in matriz:
+        np.add(estados, simbolos, out=estados)
+        np.take(planas, estados, out=estados)
+    return finais[estados // largura]
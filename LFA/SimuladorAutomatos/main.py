@@ -1,40 +1,20 @@
 import sys
-from PyQt5.QtWidgets import QApplication, QWidget, QLabel, QPushButton, QVBoxLayout, QLineEdit, QHBoxLayout, QFileDialog
-from PyQt5.QtCore import QTimer, Qt, QPointF
-from PyQt5.QtGui import QPainter, QFont, QPainterPath
+from PyQt5.QtWidgets import QApplication, QWidget, QLabel, QPushButton, QVBoxLayout, QLineEdit, QHBoxLayout, QFileDialog, QCheckBox
+from PyQt5.QtCore import QTimer, Qt, QPointF, QRect
+from PyQt5.QtGui import QPainter, QFont, QPainterPath, QPixmap
 import math
 
-class Automato:
-    def __init__(self):
-        self.estados = set()
-        self.transicoes = {}
-        self.estados_atuais = set()
-        self.estados_finais = set()
-
-    def adicionar_transicao(self, origem, simbolo, destino):
-        self.estados.add(origem)
-        self.estados.add(destino)
-        # Adicionar a transição ao dicionário
-        if (origem, simbolo) not in self.transicoes:
-            self.transicoes[(origem, simbolo)] = set()
-        self.transicoes[(origem, simbolo)].add(destino)
-        
-    def definir_estado_inicial(self, estado):
-        # Garantir que o estado inicial é um estado válido
-        self.estado_atual = estado
-
-    def definir_estados_finais(self, finais):
-        # Garantir que os estados finais são um conjunto
-        self.estados_finais = set(finais)
-
-    def proximo_estado(self, estados_atuais, simbolo):
-        # Calcular os próximos estados a partir dos estados atuais e do símbolo
-        proximos_estados = set()
-        for estado in estados_atuais:
-            if (estado, simbolo) in self.transicoes:
-                proximos_estados.update(self.transicoes[(estado, simbolo)])
-        return proximos_estados
+from automato import Automato
+from afd import compilar
+from minimizacao import minimizar
+from expressao_regular import compilar_regex
+from disposicao import posicionar
+from metricas import Metricas
+from binario import EXTENSAO, salvar_binario, abrir_automato
 
+# Raio do círculo de cada estado e margem do desenho, em pixels
+RAIO_ESTADO = 20
+MARGEM = 40
 
 class SimulatorApp(QWidget):
     def __init__(self):
@@ -52,15 +32,27 @@ class SimulatorApp(QWidget):
         self.input_transicao_origem = QLineEdit(self)
         self.input_transicao_origem.setPlaceholderText("Estado de Origem")
         self.input_transicao_simbolo = QLineEdit(self)
-        self.input_transicao_simbolo.setPlaceholderText("Símbolo")
+        self.input_transicao_simbolo.setPlaceholderText("Símbolo (ε para transição vazia)")
         self.input_transicao_destino = QLineEdit(self)
         self.input_transicao_destino.setPlaceholderText("Estado de Destino")
         self.botao_adicionar_transicao = QPushButton("Adicionar Transição", self)
         self.botao_adicionar_transicao.clicked.connect(self.adicionar_transicao)
+        # Geração do autômato a partir de uma expressão regular
+        self.input_regex = QLineEdit(self)
+        self.input_regex.setPlaceholderText("Expressão regular (ex.: (a|b)*abb)")
+        self.botao_regex = QPushButton("Gerar da Expressão Regular", self)
+        self.botao_regex.clicked.connect(self.gerar_da_regex)
         self.input_cadeia = QLineEdit(self)
         self.input_cadeia.setPlaceholderText("Digite a cadeia para simulação")
         self.start_button = QPushButton("Iniciar Simulação", self)
         self.start_button.clicked.connect(self.iniciar_simulacao)
+        # Teste imediato da cadeia no AFD compilado, sem animação
+        self.botao_testar_afd = QPushButton("Testar no AFD Compilado", self)
+        self.botao_testar_afd.clicked.connect(self.testar_afd)
+        # Métricas da simulação (estados ativos e transições por símbolo)
+        self.check_metricas = QCheckBox("Coletar métricas", self)
+        self.botao_metricas = QPushButton("Exportar Métricas", self)
+        self.botao_metricas.clicked.connect(self.exportar_metricas)
         # Botões para salvar e carregar
         self.botao_salvar = QPushButton("Salvar Projeto", self)
         self.botao_salvar.clicked.connect(self.salvar_projeto)
@@ -80,8 +72,17 @@ class SimulatorApp(QWidget):
         layout_transicoes.addWidget(self.input_transicao_destino)
         layout_transicoes.addWidget(self.botao_adicionar_transicao)
         layout.addLayout(layout_transicoes)
+        layout_regex = QHBoxLayout()
+        layout_regex.addWidget(self.input_regex)
+        layout_regex.addWidget(self.botao_regex)
+        layout.addLayout(layout_regex)
         layout.addWidget(self.input_cadeia)
         layout.addWidget(self.start_button)
+        layout.addWidget(self.botao_testar_afd)
+        layout_metricas = QHBoxLayout()
+        layout_metricas.addWidget(self.check_metricas)
+        layout_metricas.addWidget(self.botao_metricas)
+        layout.addLayout(layout_metricas)
         # Adicionar os botões ao layout
         layout.addWidget(self.botao_salvar)
         layout.addWidget(self.botao_carregar)
@@ -93,6 +94,10 @@ class SimulatorApp(QWidget):
         self.automato = Automato()
         self.cadeia = ""
         self.index = 0
+        # Desenho guardado: posições dos estados (em [0, 1]) e pixmap com as transições
+        self.posicoes = None
+        self.cena = None
+        self.pontos = {}
 
     def desenhar_transicao(self, qp, origem_pos, destino_pos, simbolo):
             # Calcular ângulo da linha
@@ -127,9 +132,20 @@ class SimulatorApp(QWidget):
         if origem and simbolo and destino:
             self.automato.adicionar_transicao(origem, simbolo, destino)
             self.label.setText(f"Transição adicionada: {origem} --{simbolo}--> {destino}")
+            self.invalidar_desenho()
         else:
             self.label.setText("Por favor, preencha todos os campos da transição.")
 
+    def gerar_da_regex(self):
+        # Substitui o autômato atual pelo AFN de Thompson da expressão
+        try:
+            self.automato = compilar_regex(self.input_regex.text())
+        except ValueError as e:
+            self.label.setText(f"Expressão inválida: {e}")
+            return
+        self.atualizar_interface()
+        self.label.setText(f"Autômato gerado com {len(self.automato.estados)} estados.")
+
     def iniciar_simulacao(self):
         estado_inicial = self.input_estado_inicial.text()
         # Verificar se o estado inicial é válido
@@ -138,11 +154,22 @@ class SimulatorApp(QWidget):
         if estado_inicial:
             # Atualizar o estado inicial no autômato
             self.automato.definir_estado_inicial(estado_inicial)
-            self.automato.estados_atuais = {estado_inicial}
+            self.automato.estados_atuais = self.automato.estados_iniciais()
         self.automato.definir_estados_finais(estados_finais)
+        # Os estados finais podem ter mudado: redesenha as cores, sem mover os estados
+        self.invalidar_desenho(posicoes=False)
+
+        # As métricas se acumulam entre as simulações até serem exportadas
+        if self.check_metricas.isChecked():
+            if self.automato.metricas is None:
+                self.automato.metricas = Metricas()
+        else:
+            self.automato.metricas = None
 
         self.cadeia = self.input_cadeia.text()
         if self.cadeia:
+            if self.automato.metricas is not None:
+                self.automato.metricas.nova_cadeia()
             self.index = 0
             self.label.setText("Simulação em andamento...")
             self.timer.start(1000)
@@ -150,20 +177,37 @@ class SimulatorApp(QWidget):
             self.label.setText("Por favor, insira uma cadeia válida.")
 
 
+    def testar_afd(self):
+        estado_inicial = self.input_estado_inicial.text()
+        if estado_inicial:
+            self.automato.definir_estado_inicial(estado_inicial)
+        self.automato.definir_estados_finais(e.strip() for e in self.input_estados_finais.text().split(','))
+        self.invalidar_desenho(posicoes=False)
+        afd = compilar(self.automato)
+        minimo = minimizar(afd)
+        resultado = "aceita" if minimo.aceita(self.input_cadeia.text()) else "rejeitada"
+        self.label.setText(f"Cadeia {resultado} (AFD compilado: {afd.quantidade_estados} estados, "
+                           f"minimizado: {minimo.quantidade_estados} estados).")
+
     def proximo_passo(self):
         # Verificar se a cadeia foi completamente lida
         if self.index < len(self.cadeia):
             # Ler o próximo símbolo e calcular os próximos estados
             simbolo = self.cadeia[self.index]
-            novos_estados = self.automato.proximo_estado(self.automato.estados_atuais, simbolo)
+            novos_estados = self.automato.passo(self.automato.estados_atuais, simbolo)
             self.index += 1
             # Atualizar os estados atuais
             if novos_estados:
                 # Atualizar os estados atuais e a interface
+                anteriores = self.automato.estados_atuais
                 self.automato.estados_atuais = novos_estados
-                # Atualizar a interface
-                self.label.setText(f"Estados atuais: {', '.join(novos_estados)}")
-                self.update()
+                # Atualizar a interface (só os destaques que mudaram)
+                texto = f"Estados atuais: {', '.join(novos_estados)}"
+                if self.automato.metricas is not None:
+                    _, _, ativos, transicoes, _ = self.automato.metricas.passos[-1]
+                    texto += f" ({ativos} ativos, {transicoes} transições seguidas)"
+                self.label.setText(texto)
+                self.destacar_estados(anteriores ^ novos_estados)
             else:
                 self.label.setText("Cadeia rejeitada.")
                 self.timer.stop()
@@ -175,8 +219,25 @@ class SimulatorApp(QWidget):
                 self.label.setText("Cadeia rejeitada.")
             self.timer.stop()
 
+    def exportar_metricas(self):
+        metricas = self.automato.metricas
+        if metricas is None or not metricas.passos:
+            self.label.setText("Nenhuma métrica coletada. Marque \"Coletar métricas\" e simule uma cadeia.")
+            return
+        nome_arquivo, _ = QFileDialog.getSaveFileName(self, "Exportar Métricas", "", "JSON (*.json);;CSV (*.csv)")
+        if nome_arquivo:
+            metricas.salvar(nome_arquivo)
+            resumo = metricas.resumo()
+            self.label.setText(f"Métricas exportadas: {resumo['ativos_medio']:.2f} estados ativos e "
+                               f"{resumo['transicoes_por_simbolo']:.2f} transições por símbolo, em média.")
+
     def salvar_projeto(self):
-        nome_arquivo, _ = QFileDialog.getSaveFileName(self, "Salvar Projeto", "", "Arquivos de Texto (*.txt)")
+        nome_arquivo, _ = QFileDialog.getSaveFileName(self, "Salvar Projeto", "",
+                                                      f"Arquivos de Texto (*.txt);;Autômato Binário (*{EXTENSAO})")
+        if nome_arquivo.endswith(EXTENSAO):
+            # Formato binário compacto, para autômatos grandes
+            salvar_binario(self.automato, nome_arquivo)
+            return
         if not nome_arquivo.endswith(".txt"):
             nome_arquivo += ".txt"
         
@@ -198,7 +259,7 @@ class SimulatorApp(QWidget):
                 
                 # Salvar alfabeto
                 f.write("#alphabet\n")
-                alfabeto = {simbolo for (_, simbolo) in self.automato.transicoes.keys()}
+                alfabeto = self.automato.alfabeto()
                 for simbolo in sorted(alfabeto):  # Ordena os símbolos do alfabeto
                     f.write(f"{simbolo}\n")
                 
@@ -209,53 +270,12 @@ class SimulatorApp(QWidget):
                         f.write(f"{origem}:{simbolo}>{destino}\n")
 
     def carregar_projeto(self):
-        nome_arquivo, _ = QFileDialog.getOpenFileName(self, "Carregar Projeto", "", "Arquivos de Texto (*.txt)")
+        nome_arquivo, _ = QFileDialog.getOpenFileName(self, "Carregar Projeto", "",
+                                                      f"Arquivos de Texto (*.txt);;Autômato Binário (*{EXTENSAO})")
         if nome_arquivo:
             try:
-                with open(nome_arquivo, 'r', encoding='utf-8') as f:
-                    lines = f.readlines()
-                    # Limpar espaços e quebras de linha extras
-                    lines = [line.strip() for line in lines if line.strip()]
-                    # Iniciar variáveis
-                    estados = set()
-                    transicoes = {}
-                    estado_inicial = None
-                    estados_finais = set()
-                    alfabeto = set()
-                    # Processar as linhas
-                    section = None
-                    for line in lines:
-                        if line.startswith("#"):
-                            section = line[1:].strip()  # Pega a seção após o #
-                        else:
-                            if section == "states":
-                                estados.add(line)
-                            elif section == "initial":
-                                estado_inicial = line
-                            elif section == "accepting":
-                                if line:
-                                    estados_finais.add(line)
-                            elif section == "alphabet":
-                                alfabeto.add(line)
-                            elif section == "transitions":
-                                # Tratar a linha de transição (origem:símbolo>destino)
-                                origem, resto = line.split(":")
-                                simbolo, destino = resto.split(">")
-                                transicoes[(origem, simbolo)] = destino
-
-                    # Verificar se todas as seções estão completas
-                    if None in [estado_inicial, estados, estados_finais, alfabeto, transicoes]:
-                        raise ValueError("Faltam seções ou dados no arquivo.")
-
-                    # Carregar no autômato
-                    self.automato.estados = estados
-                    self.automato.estado_atual = estado_inicial
-                    self.automato.estados_finais = estados_finais
-                    for (origem, simbolo), destino in transicoes.items():
-                        self.automato.adicionar_transicao(origem, simbolo, destino)
-
-                    self.atualizar_interface()
-
+                self.automato = abrir_automato(nome_arquivo)
+                self.atualizar_interface()
             except Exception as e:
                 print(f"Erro ao carregar o autômato: {e}")
                 self.label.setText("Erro ao carregar o autômato. Verifique o arquivo.")
@@ -268,42 +288,84 @@ class SimulatorApp(QWidget):
         self.input_transicao_simbolo.clear()
         self.input_transicao_destino.clear()
         self.input_cadeia.clear()
+        self.invalidar_desenho()
+
+    def invalidar_desenho(self, posicoes=True):
+        # Descarta o desenho guardado (e as posições, se o grafo mudou)
+        if posicoes:
+            self.posicoes = None
+        self.cena = None
+        self.update()
+
+    def resizeEvent(self, event):
+        # As posições continuam valendo; só a escala do desenho muda
+        self.cena = None
+        super().resizeEvent(event)
+
+    def preparar_cena(self):
+        # Calcula a disposição dos estados uma única vez por autômato
+        if self.posicoes is None:
+            arestas = [(origem, destino) for (origem, _), destinos in self.automato.transicoes.items()
+                       for destino in destinos]
+            self.posicoes = posicionar(self.automato.estados, arestas)
+        largura = max(self.width() - 2 * MARGEM, 1)
+        altura = max(self.height() - 2 * MARGEM, 1)
+        self.pontos = {estado: QPointF(MARGEM + x * largura, MARGEM + y * altura)
+                       for estado, (x, y) in self.posicoes.items()}
+        # Transições e estados (sem destaque) ficam guardados num pixmap,
+        # redesenhado só quando o autômato ou o tamanho da janela mudam
+        escala = self.devicePixelRatioF()
+        self.cena = QPixmap(self.size() * escala)
+        self.cena.setDevicePixelRatio(escala)
+        self.cena.fill(Qt.transparent)
+        qp = QPainter(self.cena)
+        qp.setFont(QFont("Arial", 10))
+        self.desenhar_transicoes(qp)
+        for estado in self.pontos:
+            self.desenhar_estado(qp, estado, Qt.red if estado in self.automato.estados_finais else Qt.white)
+        qp.end()
+
+    def desenhar_estado(self, qp, estado, cor):
+        pos = self.pontos[estado]
+        qp.setBrush(cor)
+        qp.drawEllipse(pos, RAIO_ESTADO, RAIO_ESTADO)
+        qp.drawText(int(pos.x()), int(pos.y()), estado)
+
+    def area_estado(self, estado):
+        # Retângulo a repintar quando o destaque de um estado muda
+        pos = self.pontos[estado].toPoint()
+        return QRect(pos.x() - RAIO_ESTADO - 2, pos.y() - RAIO_ESTADO - 2,
+                     2 * RAIO_ESTADO + 4, 2 * RAIO_ESTADO + 4)
+
+    def destacar_estados(self, estados):
+        # Repinta só os estados que ganharam ou perderam o destaque
+        if self.cena is None:
+            self.update()
+            return
+        for estado in estados:
+            if estado in self.pontos:
+                self.update(self.area_estado(estado))
 
     def paintEvent(self, event):
+        if self.cena is None:
+            self.preparar_cena()
         qp = QPainter()
         qp.begin(self)
         qp.setFont(QFont("Arial", 10))
-        center_x, center_y = 400, 300  # Centro do círculo
-        radius = 200  # Raio do círculo
-
-        # Distribuir estados em um círculo
-        estados_pos = {}
-        num_estados = len(self.automato.estados)
-        angle_step = 2 * math.pi / num_estados if num_estados > 0 else 0
-        for i, estado in enumerate(self.automato.estados):
-            angle = i * angle_step
-            x = center_x + radius * math.cos(angle)
-            y = center_y + radius * math.sin(angle)
-            estados_pos[estado] = QPointF(x, y)
-
-        # Desenhar estados
-        for estado, pos in estados_pos.items():
-            if estado in self.automato.estados_atuais:
-                qp.setBrush(Qt.green)  # Estado atual em verde
-            elif estado in self.automato.estados_finais:
-                qp.setBrush(Qt.red)  # Estado final em vermelho
-            else:
-                qp.setBrush(Qt.white)  # Outros estados em branco
-            qp.drawEllipse(pos, 20, 20)
-            qp.drawText(int(pos.x()), int(pos.y()), estado)
+        qp.drawPixmap(0, 0, self.cena)
+        # Estado atual em verde, por cima do desenho guardado
+        area = event.rect()
+        for estado in self.automato.estados_atuais:
+            if estado in self.pontos and area.intersects(self.area_estado(estado)):
+                self.desenhar_estado(qp, estado, Qt.green)
+        qp.end()
 
+    def desenhar_transicoes(self, qp):
         # Desenhar transições com curvas para evitar sobreposição
+        estados_pos = self.pontos
         transicao_offset = {}  # Para rastrear deslocamento entre pares de estados
         for (origem, simbolo), destinos in self.automato.transicoes.items():
             origem_pos = estados_pos[origem]
-            if isinstance(destinos, set):
-                destinos = list(destinos)  # Garantir que é iterável
-
             for destino in destinos:
                 if destino in estados_pos:
                     destino_pos = estados_pos[destino]
@@ -319,8 +381,9 @@ class SimulatorApp(QWidget):
                     mid_x = (origem_pos.x() + destino_pos.x()) / 2
                     mid_y = (origem_pos.y() + destino_pos.y()) / 2
                     curve_offset = 20 + offset * 10  # Incrementar o deslocamento para múltiplas transições
-                    control_x = mid_x + curve_offset * (destino_pos.y() - origem_pos.y()) / radius
-                    control_y = mid_y - curve_offset * (destino_pos.x() - origem_pos.x()) / radius
+                    distancia = max(math.hypot(destino_pos.x() - origem_pos.x(), destino_pos.y() - origem_pos.y()), 1)
+                    control_x = mid_x + curve_offset * (destino_pos.y() - origem_pos.y()) / distancia
+                    control_y = mid_y - curve_offset * (destino_pos.x() - origem_pos.x()) / distancia
                     # Desenhar a curva
                     path = QPainterPath()
                     path.moveTo(origem_pos)
@@ -333,8 +396,6 @@ class SimulatorApp(QWidget):
                     simbolo_y = control_y
                     qp.drawText(int(simbolo_x), int(simbolo_y), simbolo)
 
-        qp.end()
-
     def desenhar_seta(self, qp, origem, destino, control_x, control_y):
         # Desenhar uma seta no final de uma transição
         angle = math.atan2(destino.y() - origem.y(), destino.x() - origem.x())
@@ -0,0 +1,91 @@
+# Métricas da simulação de um Automato: quantos estados ficam ativos a cada
+# símbolo, quantas transições são seguidas por símbolo e quais estados e
+# pares (estado, símbolo) são mais usados. Autômatos com muitos estados
+# ativos por passo são os que mais ganham com a determinização (afd.py).
+# Para coletar, basta atribuir `automato.metricas = Metricas()`; sem
+# coletor, a simulação não muda.
+import argparse
+import csv
+import json
+from collections import Counter
+
+from binario import abrir_automato
+
+
+class Metricas:
+    def __init__(self):
+        self.limpar()
+
+    def limpar(self):
+        self.cadeias = 0
+        # Um registro por símbolo lido: (cadeia, símbolo, ativos antes, transições seguidas, ativos depois)
+        self.passos = []
+        self.estados = Counter()
+        self.pares = Counter()
+
+    def nova_cadeia(self):
+        self.cadeias += 1
+
+    def registrar(self, estados, simbolo, transicoes, proximos):
+        # Chamado por Automato.passo a cada símbolo simulado
+        seguidas = 0
+        for estado in estados:
+            self.estados[estado] += 1
+            destinos = transicoes.get((estado, simbolo))
+            if destinos:
+                self.pares[(estado, simbolo)] += 1
+                seguidas += len(destinos)
+        self.passos.append((self.cadeias, simbolo, len(estados), seguidas, len(proximos)))
+
+    def resumo(self, quantidade=10):
+        total = len(self.passos)
+        ativos = [passo[2] for passo in self.passos]
+        seguidas = sum(passo[3] for passo in self.passos)
+        return {
+            "cadeias": self.cadeias,
+            "simbolos": total,
+            "ativos_medio": sum(ativos) / total if total else 0,
+            "ativos_maximo": max(ativos, default=0),
+            # Transições seguidas por símbolo: 1 num AFD, mais que 1 quando o AFN ramifica
+            "transicoes_por_simbolo": seguidas / total if total else 0,
+            "estados_quentes": [[estado, vezes] for estado, vezes in self.estados.most_common(quantidade)],
+            "pares_quentes": [[estado, simbolo, vezes]
+                              for (estado, simbolo), vezes in self.pares.most_common(quantidade)],
+        }
+
+    def salvar_json(self, caminho):
+        dados = self.resumo()
+        dados["passos"] = [list(passo) for passo in self.passos]
+        with open(caminho, 'w', encoding='utf-8') as arquivo:
+            json.dump(dados, arquivo, ensure_ascii=False, indent=2)
+
+    def salvar_csv(self, caminho):
+        # Uma linha por símbolo lido; o resumo fica no JSON
+        with open(caminho, 'w', encoding='utf-8', newline='') as arquivo:
+            escritor = csv.writer(arquivo)
+            escritor.writerow(["cadeia", "simbolo", "ativos", "transicoes", "proximos"])
+            escritor.writerows(self.passos)
+
+    def salvar(self, caminho):
+        # Formato pela extensão: .csv ou JSON
+        if caminho.endswith(".csv"):
+            self.salvar_csv(caminho)
+        else:
+            self.salvar_json(caminho)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Coleta métricas da simulação de um autômato sobre várias cadeias.")
+    parser.add_argument("automato", help="Arquivo do autômato (texto ou .aut)")
+    parser.add_argument("entradas", help="Arquivo com uma cadeia por linha")
+    parser.add_argument("--saida", default=None, help="Arquivo .json ou .csv para exportar as métricas")
+    args = parser.parse_args()
+
+    automato = abrir_automato(args.automato)
+    automato.metricas = Metricas()
+    with open(args.entradas, 'r', encoding='utf-8') as arquivo:
+        for linha in arquivo:
+            automato.aceita(linha.rstrip("\r\n"))
+    if args.saida:
+        automato.metricas.salvar(args.saida)
+    print(json.dumps(automato.metricas.resumo(), ensure_ascii=False, indent=2))
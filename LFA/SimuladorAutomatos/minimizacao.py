@@ -0,0 +1,80 @@
+# Minimização de AFD compilado pelo algoritmo de Hopcroft (refinamento de
+# partições), em O(n·k·log n) para n estados e k símbolos.
+from array import array
+from collections import deque
+
+from afd import AFDCompilado
+
+
+def minimizar(afd):
+    n = afd.quantidade_estados
+    k = afd.k
+    tabela = afd.tabela
+    # Transições inversas: inversa[c][t] = estados que vão para t lendo c
+    inversa = [[[] for _ in range(n)] for _ in range(k)]
+    for estado in range(n):
+        base = estado * k
+        for coluna in range(k):
+            inversa[coluna][tabela[base + coluna]].append(estado)
+    # Partição inicial: estados de aceitação e de rejeição
+    finais = {e for e in range(n) if afd.finais[e]}
+    nao_finais = set(range(n)) - finais
+    blocos = [b for b in (finais, nao_finais) if b]
+    bloco_de = [0] * n
+    for indice, bloco in enumerate(blocos):
+        for estado in bloco:
+            bloco_de[estado] = indice
+    # Blocos ainda a usar como divisores; basta começar pelo menor
+    fila = deque()
+    pendentes = set()
+    if len(blocos) == 2:
+        menor = 0 if len(blocos[0]) <= len(blocos[1]) else 1
+        fila.append(menor)
+        pendentes.add(menor)
+    while fila:
+        divisor = fila.popleft()
+        pendentes.discard(divisor)
+        alvo = list(blocos[divisor])
+        for coluna in range(k):
+            # Estados que chegam ao divisor lendo este símbolo, agrupados por bloco
+            afetados = {}
+            for destino in alvo:
+                for origem in inversa[coluna][destino]:
+                    afetados.setdefault(bloco_de[origem], []).append(origem)
+            for indice, membros in afetados.items():
+                if len(membros) == len(blocos[indice]):
+                    continue
+                # Divide o bloco entre quem chega ao divisor e quem não chega
+                novo = set(membros)
+                blocos[indice] -= novo
+                novo_indice = len(blocos)
+                blocos.append(novo)
+                for estado in novo:
+                    bloco_de[estado] = novo_indice
+                if indice in pendentes:
+                    fila.append(novo_indice)
+                    pendentes.add(novo_indice)
+                else:
+                    menor = novo_indice if len(novo) <= len(blocos[indice]) else indice
+                    fila.append(menor)
+                    pendentes.add(menor)
+    # Renumera os blocos com o estado inicial primeiro e monta a nova tabela
+    ordem = {bloco_de[afd.inicial]: 0}
+    for estado in range(n):
+        ordem.setdefault(bloco_de[estado], len(ordem))
+    representantes = [0] * len(ordem)
+    for estado in range(n):
+        representantes[ordem[bloco_de[estado]]] = estado
+    nova_tabela = array('i')
+    for representante in representantes:
+        base = representante * k
+        for coluna in range(k):
+            nova_tabela.append(ordem[bloco_de[tabela[base + coluna]]])
+    novos_finais = array('b', (afd.finais[r] for r in representantes))
+    conjuntos = None
+    if afd.conjuntos is not None:
+        conjuntos = [frozenset() for _ in representantes]
+        for estado in range(n):
+            novo = ordem[bloco_de[estado]]
+            conjuntos[novo] = conjuntos[novo] | afd.conjuntos[estado]
+    return AFDCompilado(dict(afd.simbolos), nova_tabela, 0, novos_finais, conjuntos)
@@ -0,0 +1,145 @@
+# Operações entre dois autômatos pela construção do produto, feita sob
+# demanda: cada estado do produto é um par (conjunto de estados de A,
+# conjunto de estados de B), já com o fecho-ε, e só os pares alcançáveis a
+# partir do par inicial são criados. Vazio e equivalência param no primeiro
+# par de aceitação encontrado, então comparar autômatos grandes custa só a
+# parte do produto explorada até achar um contraexemplo.
+import argparse
+from array import array
+from collections import deque
+
+from afd import AFDCompilado
+from binario import abrir_simulador
+
+# Quando um par (conjunto de A, conjunto de B) é de aceitação
+OPERACOES = {
+    "intersecao": lambda a, b: a and b,
+    "uniao": lambda a, b: a or b,
+    "diferenca": lambda a, b: a and not b,
+    "diferenca_simetrica": lambda a, b: a != b,
+}
+
+
+def _alfabeto(automatos):
+    return sorted(set().union(*(automato.alfabeto() for automato in automatos)))
+
+
+def _iniciais(automatos):
+    return tuple(frozenset(automato.estados_iniciais()) for automato in automatos)
+
+
+def _aceita(automatos, estados, aceitacao):
+    return aceitacao(*(bool(conjunto & automato.estados_finais)
+                       for automato, conjunto in zip(automatos, estados)))
+
+
+def _proximos(automatos, estados, simbolo):
+    return tuple(frozenset(automato.proximo_estado(conjunto, simbolo))
+                 for automato, conjunto in zip(automatos, estados))
+
+
+def produto(a, b, operacao):
+    # AFD do produto com todos os pares alcançáveis; `operacao` é uma chave de
+    # OPERACOES. Cada conjunto do AFD junta os estados de A, marcados com 0,
+    # e os de B, marcados com 1, para continuar valendo na minimização
+    aceitacao = OPERACOES[operacao]
+    automatos = (a, b)
+    alfabeto = _alfabeto(automatos)
+    simbolos = {simbolo: i for i, simbolo in enumerate(alfabeto)}
+    inicial = _iniciais(automatos)
+    indices = {inicial: 0}
+    pares = [inicial]
+    tabela = array('i')
+    fila = deque([inicial])
+    while fila:
+        par = fila.popleft()
+        for simbolo in alfabeto:
+            destino = _proximos(automatos, par, simbolo)
+            if destino not in indices:
+                indices[destino] = len(pares)
+                pares.append(destino)
+                fila.append(destino)
+            tabela.append(indices[destino])
+    finais = array('b', (1 if _aceita(automatos, par, aceitacao) else 0 for par in pares))
+    conjuntos = [frozenset((0, e) for e in de_a) | frozenset((1, e) for e in de_b) for de_a, de_b in pares]
+    return AFDCompilado(simbolos, tabela, 0, finais, conjuntos)
+
+
+def intersecao(a, b):
+    return produto(a, b, "intersecao")
+
+
+def uniao(a, b):
+    return produto(a, b, "uniao")
+
+
+def diferenca(a, b):
+    return produto(a, b, "diferenca")
+
+
+def testemunha(automatos, aceitacao):
+    # Menor cadeia (em largura) que leva a uma combinação de aceitação, ou
+    # None se nenhuma é alcançável. Guarda só o pai de cada combinação
+    # visitada, para reconstruir a cadeia no fim
+    alfabeto = _alfabeto(automatos)
+    inicial = _iniciais(automatos)
+    if _aceita(automatos, inicial, aceitacao):
+        return ""
+    pais = {inicial: None}
+    fila = deque([inicial])
+    while fila:
+        estados = fila.popleft()
+        for simbolo in alfabeto:
+            destino = _proximos(automatos, estados, simbolo)
+            if destino in pais:
+                continue
+            pais[destino] = (estados, simbolo)
+            if _aceita(automatos, destino, aceitacao):
+                cadeia = []
+                while pais[destino] is not None:
+                    destino, simbolo = pais[destino]
+                    cadeia.append(simbolo)
+                return "".join(reversed(cadeia))
+            # Sem estados ativos em nenhum autômato, nada mais é alcançável
+            if any(destino):
+                fila.append(destino)
+    return None
+
+
+def vazio(automato):
+    # A linguagem do autômato é vazia?
+    return testemunha((automato,), lambda a: a) is None
+
+
+def intersecao_vazia(a, b):
+    return testemunha((a, b), OPERACOES["intersecao"]) is None
+
+
+def contido(a, b):
+    # L(A) ⊆ L(B)? Retorna (resultado, cadeia de A que B rejeita)
+    cadeia = testemunha((a, b), OPERACOES["diferenca"])
+    return cadeia is None, cadeia
+
+
+def equivalentes(a, b):
+    # L(A) == L(B)? Retorna (resultado, contraexemplo): o contraexemplo é a
+    # menor cadeia aceita por exatamente um dos dois
+    cadeia = testemunha((a, b), OPERACOES["diferenca_simetrica"])
+    return cadeia is None, cadeia
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compara as linguagens de dois autômatos salvos.")
+    parser.add_argument("a", help="Primeiro autômato (texto ou .aut)")
+    parser.add_argument("b", help="Segundo autômato (texto ou .aut)")
+    args = parser.parse_args()
+
+    a = abrir_simulador(args.a)
+    b = abrir_simulador(args.b)
+    iguais, contraexemplo = equivalentes(a, b)
+    if iguais:
+        print("Equivalentes.")
+    else:
+        lado = "A" if a.aceita(contraexemplo) else "B"
+        print(f"Diferentes: {contraexemplo!r} é aceita só por {lado}.")
+    print(f"Interseção vazia: {'sim' if intersecao_vazia(a, b) else 'não'}")